@@ -0,0 +1,37 @@
+"""Module to find where Floyd–Warshall overtakes repeated Dijkstra for all pairs.
+
+Run from the repository root with: python -m benchmarks.all_pairs
+"""
+
+from time import perf_counter
+
+import numpy as np
+
+from tools.algorithms.dijkstra import DijkstraSearch
+from tools.api.generators import erdos_renyi, to_graph
+
+SEED = 42
+
+def main():
+    """Prints the time of both all-pairs methods over growing densities."""
+    for vertices in (300, 1_000):
+        for density in (0.003, 0.01, 0.03, 0.1):
+            edges = int(density * vertices * vertices)
+            graph = to_graph(
+                vertices, erdos_renyi(vertices, edges, SEED, 100), DijkstraSearch(integer_ids=True)
+            )
+            timings = {}
+            results = {}
+
+            for method in ('floyd_warshall', 'dijkstra'):
+                started = perf_counter()
+                results[method] = graph.all_pairs(method, workers=1)[0]
+                timings[method] = perf_counter() - started
+
+            assert np.array_equal(results['floyd_warshall'], results['dijkstra'])
+            print(f"{vertices:>6} vertices  density{density:>7.3f}  "
+                  f"floyd_warshall{timings['floyd_warshall']:>8.2f} s  "
+                  f"dijkstra{timings['dijkstra']:>8.2f} s")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""Module to time many-source shortest paths serially and over a process pool.
+
+Run from the repository root with: python -m benchmarks.batch
+"""
+
+import os
+from time import perf_counter
+
+from tools.algorithms.dijkstra import DijkstraSearch
+from tools.api.generators import erdos_renyi, to_graph
+
+SEED = 42
+VERTICES = 100_000
+SOURCES = 64
+
+def main():
+    """Prints the wall time of shortest_paths_from for a growing number of workers."""
+    graph = to_graph(
+        VERTICES, erdos_renyi(VERTICES, VERTICES * 4, SEED, 100), DijkstraSearch(integer_ids=True)
+    )
+    sources = graph.get_vertices()[:SOURCES]
+    workers = 1
+    baseline = None
+
+    while workers <= (os.cpu_count() or 1):
+        started = perf_counter()
+        distance, _ = graph.shortest_paths_from(sources, workers)
+        elapsed = perf_counter() - started
+
+        if baseline is None:
+            baseline = distance
+        else:
+            assert (distance == baseline).all()
+
+        print(f"{workers:>3} workers{elapsed:>9.2f} s  {SOURCES / elapsed:>7.1f} sources/s")
+        workers *= 2
+
+if __name__ == '__main__':
+    main()
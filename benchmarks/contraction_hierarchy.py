@@ -0,0 +1,82 @@
+"""Module to check contraction hierarchy queries against DijkstraSearch and time them.
+
+Run from the repository root with: python -m benchmarks.contraction_hierarchy
+"""
+
+import os
+import tempfile
+from random import Random
+from time import perf_counter
+
+from tools.algorithms.contraction_hierarchy import ContractionHierarchy
+from tools.algorithms.dijkstra import DijkstraSearch
+from tools.api.generators import grid, to_graph
+
+SEED = 42
+QUERIES = 200
+
+def check(graph: DijkstraSearch, hierarchy: ContractionHierarchy, pairs: list[tuple[int, int]]):
+    """Raises AssertionError when a query disagrees with a full run of DijkstraSearch."""
+    vertices = graph.get_vertices()
+
+    for source, target in pairs:
+        expected = graph.run(vertices[source]).get_distance(vertices[target])
+        path = hierarchy.path(source, target)
+        assert hierarchy.distance(source, target) == expected, (source, target)
+
+        if expected == float('inf'):
+            assert not path, (source, target)
+            continue
+
+        length = sum(
+            min(edge.get_weight() for edge in vertices[start].get_edges()
+                if edge.get_destination() is vertices[end])
+            for start, end in zip(path, path[1:])
+        )
+        assert path[0] == source and path[-1] == target and length == expected, (source, target)
+
+def measure(name: str, graph: DijkstraSearch):
+    """Prints the preprocessing cost and the query time against a full Dijkstra run."""
+    size = len(graph.get_vertices())
+    rng = Random(SEED)
+    pairs = [(rng.randrange(size), rng.randrange(size)) for _ in range(QUERIES)]
+
+    started = perf_counter()
+    built = ContractionHierarchy.build(graph)
+    preprocessing = perf_counter() - started
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'graph.ch')
+        built.save(path)
+        hierarchy = ContractionHierarchy.load(path)
+        check(graph, hierarchy, pairs[:QUERIES // 10])
+
+        started = perf_counter()
+
+        for source, target in pairs:
+            hierarchy.distance(source, target)
+
+        query = (perf_counter() - started) / QUERIES
+        del hierarchy
+
+    vertices = graph.get_vertices()
+    started = perf_counter()
+
+    for source, target in pairs[:QUERIES // 10]:
+        graph.run(vertices[source], target=vertices[target])
+
+    dijkstra = (perf_counter() - started) / (QUERIES // 10)
+    print(f"{name:<14}{size:>8} vertices  build{preprocessing:>8.2f} s  "
+          f"query{query * 1e3:>8.3f} ms  dijkstra{dijkstra * 1e3:>9.3f} ms")
+
+def main():
+    """
+    Checks and times hierarchies of generated road-like grids. Random graphs have no
+    hierarchy to exploit and contract into a dense core, so they are left out.
+    """
+    for side in (50, 100):
+        graph = to_graph(side * side, grid(side, side, SEED, 100), DijkstraSearch(integer_ids=True))
+        measure('grid', graph)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""Module to compare the Dijkstra implementations on generated graphs.
+
+Run from the repository root with: python -m benchmarks.dijkstra
+"""
+
+from random import Random
+from time import perf_counter
+
+from tools.algorithms.dijkstra import DijkstraSearch
+from tools.algorithms.heuristics import manhattan
+from tools.api.generators import erdos_renyi, grid, grid_coordinates, to_graph
+from tools.api.state import StateStore
+
+SEED = 42
+SCAN_LIMIT = 5_000
+STARTS = (0, 1, 2)
+
+def build(name: str, vertices: int) -> DijkstraSearch:
+    """Returns a generated graph of roughly the given number of vertices."""
+    match name:
+        case 'erdos_renyi':
+            return to_graph(
+                vertices, erdos_renyi(vertices, vertices * 4, SEED, 100),
+                DijkstraSearch(integer_ids=True)
+            )
+        case 'grid':
+            side = int(vertices ** 0.5)
+            return to_graph(
+                side * side, grid(side, side, SEED, 100), DijkstraSearch(integer_ids=True)
+            )
+        case _:
+            raise ValueError(f'{name} is incorrect value for parameter name')
+
+def seconds(graph: DijkstraSearch, method: str) -> float:
+    """Returns the mean wall time of a search from each of the start vertices."""
+    workspace = graph.search(graph.get_vertex(STARTS[0]), method=method)
+    started = perf_counter()
+
+    for start in STARTS:
+        graph.search(graph.get_vertex(start), workspace, method=method)
+
+    return (perf_counter() - started) / len(STARTS)
+
+def touched(state: StateStore) -> int:
+    """Returns the number of vertices a search has reached."""
+    return sum(1 for stamp in state.stamp if stamp == state.epoch)
+
+def point_to_point(side: int):
+    """Prints the cost of a corner to centre query on a unit-weight grid."""
+    graph = to_graph(side * side, grid(side, side, SEED), DijkstraSearch(integer_ids=True))
+    start = graph.get_vertex(0)
+    target = graph.get_vertex(side * side // 2 + side // 2)
+    variants = (
+        ('full', {}),
+        ('target', {'target': target}),
+        ('a_star', {'target': target, 'heuristic': manhattan(grid_coordinates(side, side))}),
+    )
+
+    for variant, options in variants:
+        started = perf_counter()
+        state = graph.search(start, **options)
+        elapsed = perf_counter() - started
+        print(f"{'grid':<14}{side * side:>9} vertices  {variant:<8}{elapsed:>8.3f} s"
+              f"{touched(state):>10} touched")
+
+def single_pair(vertices: int, queries: int = 20):
+    """Prints the mean time of random single-pair queries on a sparse random graph."""
+    graph = build('erdos_renyi', vertices)
+    rng = Random(SEED)
+    pairs = [
+        (graph.get_vertex(rng.randrange(vertices)), graph.get_vertex(rng.randrange(vertices)))
+        for _ in range(queries)
+    ]
+    workspace = graph.search(pairs[0][0], method='bidirectional', target=pairs[0][1])
+
+    for method in ('heap', 'bidirectional'):
+        started = perf_counter()
+
+        for start, target in pairs:
+            graph.search(start, workspace, method=method, target=target)
+
+        elapsed = (perf_counter() - started) / queries
+        print(f"{'erdos_renyi':<14}{vertices:>9} vertices  {method:<14}{elapsed:>8.4f} s/query")
+
+def crossover(side: int = 200):
+    """Prints the time of the heap and bucket methods as the max weight grows."""
+    for max_weight in (1, 4, 16, 64, 256, 1_024, 65_536, 1_000_000):
+        graph = to_graph(
+            side * side, grid(side, side, SEED, max_weight), DijkstraSearch(integer_ids=True)
+        )
+        timings = '  '.join(
+            f"{method}{seconds(graph, method):>8.3f} s" for method in ('heap', 'dial', 'radix')
+        )
+        print(f"{'grid':<14}{side * side:>9} vertices  max weight{max_weight:>9}  {timings}")
+
+def main():
+    """Prints the time of every method on growing graphs."""
+    for name in ('erdos_renyi', 'grid'):
+        for vertices in (1_000, 5_000, 50_000, 200_000):
+            graph = build(name, vertices)
+            heap = seconds(graph, 'heap')
+            scan = f"{'skipped':>12}"
+
+            if vertices <= SCAN_LIMIT:
+                scan = f"{seconds(graph, 'scan'):>10.3f} s"
+
+            size = len(graph.get_vertices())
+            print(f"{name:<14}{size:>9} vertices  heap{heap:>10.3f} s  scan{scan}")
+
+    point_to_point(400)
+    single_pair(200_000)
+    crossover()
+
+if __name__ == '__main__':
+    main()
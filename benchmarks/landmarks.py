@@ -0,0 +1,47 @@
+"""Module to compare ALT queries against plain Dijkstra on a generated grid.
+
+Run from the repository root with: python -m benchmarks.landmarks
+"""
+
+from random import Random
+from time import perf_counter
+
+from tools.algorithms.dijkstra import DijkstraSearch
+from tools.algorithms.landmarks import LandmarkTable
+from tools.api.generators import grid, to_graph
+
+SEED = 42
+QUERIES = 30
+
+def main():
+    """Prints the preprocessing cost and the mean query time with and without landmarks."""
+    side = 200
+    graph = to_graph(side * side, grid(side, side, SEED, 100), DijkstraSearch(integer_ids=True))
+    vertices = graph.get_vertices()
+    rng = Random(SEED)
+    pairs = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(QUERIES)]
+
+    for count in (4, 16):
+        started = perf_counter()
+        table = LandmarkTable.build(graph, count, SEED)
+        print(f"{count:>3} landmarks  build{perf_counter() - started:>8.2f} s")
+
+        for name, heuristic in (('dijkstra', None), ('alt', table.lower_bound)):
+            workspace = graph.search(pairs[0][0])
+            started = perf_counter()
+
+            for start, target in pairs:
+                graph.search(start, workspace, target=target, heuristic=heuristic)
+
+            elapsed = (perf_counter() - started) / QUERIES
+            reached = 0
+
+            for start, target in pairs:
+                state = graph.search(start, workspace, target=target, heuristic=heuristic)
+                reached += sum(1 for stamp in state.stamp if stamp == state.epoch)
+                assert state.get_distance(target) == graph.search(start).get_distance(target)
+
+            print(f"{'':>15}{name:<10}{elapsed * 1e3:>9.2f} ms{reached // QUERIES:>9} touched")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""Module to measure the per-call cost of the validation decorators.
+
+Run from the repository root with: python -m benchmarks.validators
+"""
+
+from timeit import repeat
+
+from helper.validators import validate_labels, validate_param_keyword, trusted
+
+NUMBER = 200_000
+REPEAT = 5
+
+def legacy_validate_labels(*label_args):
+    """The label decorator as it was before its checks were resolved at decoration time."""
+    def decorator(func):
+        def wrapper(self, *args, **kwargs):
+            arg_names = func.__code__.co_varnames[:func.__code__.co_argcount]
+            arg_map = dict(zip(arg_names, (self, *args))) | kwargs
+
+            for label in label_args:
+                value: str | None = arg_map.get(label)
+
+                if value is None:
+                    return "Invalid: Label must not be empty"
+
+                if not isinstance(value, str) or not value.isalpha():
+                    return "Invalid: Only accepts alphabetics without spaces in between"
+
+            return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+def legacy_validate_param_keyword(keyword_args):
+    """The keyword decorator as it was before its checks were resolved at decoration time."""
+    def decorator(func):
+        def wrapper(self, *args, **kwargs):
+            for key in kwargs:
+                if key not in keyword_args:
+                    raise AttributeError(f"Invalid parameter: {key}")
+
+            return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+KEYWORDS = {'color': 0, 'predecessor': None, 'distance': 0}.keys()
+
+class Subject:
+    """A class exposing the same methods decorated in every available way."""
+
+    def plain_label(self, label: str):
+        """Accepts a label without validation."""
+        return label
+
+    @legacy_validate_labels('label')
+    def legacy_label(self, label: str):
+        """Accepts a label validated by the legacy decorator."""
+        return label
+
+    @validate_labels('label')
+    def label(self, label: str):
+        """Accepts a label validated by the current decorator."""
+        return label
+
+    def plain_update(self, **kwargs):
+        """Accepts keywords without validation."""
+        return kwargs
+
+    @legacy_validate_param_keyword(KEYWORDS)
+    def legacy_update(self, **kwargs):
+        """Accepts keywords validated by the legacy decorator."""
+        return kwargs
+
+    @validate_param_keyword(KEYWORDS)
+    def update(self, **kwargs):
+        """Accepts keywords validated by the current decorator."""
+        return kwargs
+
+def per_call(statement) -> float:
+    """Returns the best cost of one call in nanoseconds over a few repeats."""
+    return min(repeat(statement, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e9
+
+def main():
+    """Prints the per-call cost of every decorator variant."""
+    subject = Subject()
+    label = Subject.label.__wrapped__
+    update = Subject.update.__wrapped__
+    labels, keyword = 'validate_labels', 'validate_param_keyword'
+    rows = [
+        (labels, 'undecorated', lambda: subject.plain_label('Label')),
+        (labels, 'legacy', lambda: subject.legacy_label('Label')),
+        (labels, 'precompiled', lambda: subject.label('Label')),
+        (labels, '__wrapped__', lambda: label(subject, 'Label')),
+        (keyword, 'undecorated', lambda: subject.plain_update(color=1, distance=2)),
+        (keyword, 'legacy', lambda: subject.legacy_update(color=1, distance=2)),
+        (keyword, 'precompiled', lambda: subject.update(color=1, distance=2)),
+        (keyword, '__wrapped__', lambda: update(subject, color=1, distance=2)),
+    ]
+
+    for decorator, variant, statement in rows:
+        print(f"{decorator:<24}{variant:<14}{per_call(statement):>8.1f} ns/call")
+
+    with trusted():
+        for decorator, statement in (
+            (labels, lambda: subject.label('Label')),
+            (keyword, lambda: subject.update(color=1, distance=2)),
+        ):
+            print(f"{decorator:<24}{'trusted':<14}{per_call(statement):>8.1f} ns/call")
+
+if __name__ == '__main__':
+    main()
@@ -1,20 +1,60 @@
 """A module to help validate functions in a decorator-way."""
 
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from inspect import signature
+
+_TRUSTED: ContextVar[bool] = ContextVar('trusted', default=False)
+
+@contextmanager
+def trusted():
+    """
+    Skips the checks of every decorated function inside the block, in the current thread
+    or task only. Meant for bulk paths whose input is already known to be valid; internal
+    hot paths call the undecorated function through its __wrapped__ attribute instead.
+    """
+    token = _TRUSTED.set(True)
+
+    try:
+        yield
+    finally:
+        _TRUSTED.reset(token)
+
+def _label_error(value) -> str:
+    """Returns the error message of an invalid label, or an empty string."""
+    if value is None:
+        return "Invalid: Label must not be empty"
+
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return ''
+
+    if not isinstance(value, str) or not value.isalpha():
+        return "Invalid: Only accepts alphabetics without spaces in between"
+
+    return ''
+
 def validate_labels(*label_args):
-    """Decorator to validate labels of vertices and edges."""
+    """
+    Decorator to validate labels of vertices and edges.
+    A label is either an alphabetic string or a non-negative integer identifier.
+    The position of every label argument is resolved once when decorating.
+    """
     def decorator(func):
-        def wrapper(self, *args, **kwargs):
-            arg_names = func.__code__.co_varnames[:func.__code__.co_argcount]
-            arg_map = dict(zip(arg_names, (self, *args))) | kwargs
+        parameters = list(signature(func).parameters)
+        positions = [(parameters.index(label) - 1, label) for label in label_args]
 
-            for label in label_args:
-                value: str | None = arg_map.get(label)
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if not _TRUSTED.get():
+                for position, label in positions:
+                    value = args[position] if position < len(args) else kwargs.get(label)
 
-                if value is None:
-                    return "Invalid: Label must not be empty"
+                    if value.__class__ is not str or not value.isalpha():
+                        error = _label_error(value)
 
-                if not isinstance(value, str) or not value.isalpha():
-                    return "Invalid: Only accepts alphabetics without spaces in between"
+                        if error:
+                            return error
 
             return func(self, *args, **kwargs)
         return wrapper
@@ -22,11 +62,14 @@ def validate_labels(*label_args):
 
 def validate_param_keyword(keyword_args):
     """Decorator to prevent alteration on the attribute if one keyword parameter does not exist"""
+    allowed = frozenset(keyword_args)
+
     def decorator(func):
+        @wraps(func)
         def wrapper(self, *args, **kwargs):
-            for key in kwargs:
-                if key not in keyword_args:
-                    raise AttributeError(f"Invalid parameter: {key}")
+            if not allowed.issuperset(kwargs) and not _TRUSTED.get():
+                key = next(key for key in kwargs if key not in allowed)
+                raise AttributeError(f"Invalid parameter: {key}")
 
             return func(self, *args, **kwargs)
         return wrapper
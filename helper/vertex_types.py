@@ -7,13 +7,13 @@ if TYPE_CHECKING:
 
 class BFSVertexType(TypedDict, total=False):
     """A TypedDict for BFS vertex attributes."""
-    color: str
+    color: str | int
     predecessor: 'Vertex | None'
     distance: int | float
 
 class DFSVertexType(TypedDict, total=False):
     """A TypedDict for DFS vertex attributes."""
-    color: str
+    color: str | int
     predecessor: 'Vertex | None'
     discovery_time: int | float
     finish_time: int | float
@@ -96,11 +96,7 @@ class BFSProgram(BaseProgram):
 
     def __edge_complement_exists(self, source: Vertex, destination: Vertex) -> bool:
         """Checkes if there's a complement of such edge."""
-        for edge in destination.get_edges():
-            if edge.get_destination() is source:
-                return True
-
-        return False
+        return self.__bfs.has_edge(destination, source)
 
     def __edge_content(self, src: Vertex | None, dest: Vertex | None) -> str:
         """Provides contens when operation with an edge."""
@@ -156,13 +152,12 @@ class BFSProgram(BaseProgram):
 
     def __edge_exists(self, source: Vertex, destination: Vertex) -> bool:
         """Checks if such edge is valid"""
-        for edge in source.get_edges():
-            if edge.get_destination() is destination:
-                src_label, dest_label = source.get_label(), destination.get_label()
-                self._base.message = f"Invalid: Edge({src_label}, {dest_label}) already exists"
-                self._append_error_message(self._base.message)
-                self._extrn.resume = False
-                return True
+        if self.__bfs.has_edge(source, destination):
+            src_label, dest_label = source.get_label(), destination.get_label()
+            self._base.message = f"Invalid: Edge({src_label}, {dest_label}) already exists"
+            self._append_error_message(self._base.message)
+            self._extrn.resume = False
+            return True
 
         return False
 
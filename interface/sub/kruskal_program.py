@@ -167,13 +167,12 @@ class KruskalProgram(BaseProgram):
 
     def __edge_exists(self, source: Vertex, destination: Vertex) -> bool:
         """Checks if such edge is valid"""
-        for edge in source.get_edges():
-            if edge.get_destination() is destination:
-                src_label, dest_label = source.get_label(), destination.get_label()
-                self._base.message = f"Invalid: Edge({src_label}, {dest_label}) already exists"
-                self._append_error_message(self._base.message)
-                self._extrn.resume = False
-                return True
+        if self.__kruskal.has_edge(source, destination):
+            src_label, dest_label = source.get_label(), destination.get_label()
+            self._base.message = f"Invalid: Edge({src_label}, {dest_label}) already exists"
+            self._append_error_message(self._base.message)
+            self._extrn.resume = False
+            return True
 
         return False
 
@@ -0,0 +1,87 @@
+"""Checks bidirectional BFS and Dijkstra against one-directional searches."""
+
+import random
+
+import pytest
+
+from tools.algorithms.breadth_first_search import BreadthFirstSearch
+from tools.algorithms.dijkstra import DijkstraSearch
+from tools.api.generators import erdos_renyi, to_graph
+
+VERTICES = 120
+
+def build_graph(seed: int, graph: BreadthFirstSearch | DijkstraSearch):
+    """
+    Fills the graph with a sparse random directed graph with parallel edges, unreachable
+    pairs and isolated last vertices.
+    """
+    rng = random.Random(seed)
+    edges = list(erdos_renyi(VERTICES - 4, 2 * VERTICES, seed, 15))
+    edges += [
+        (source, destination, rng.randint(1, 15))
+        for source, destination, _ in rng.sample(edges, 20)
+    ]
+
+    return to_graph(VERTICES, edges, graph)
+
+def pairs(seed: int, graph) -> list[tuple]:
+    """Returns random start and target pairs, including one pair of a vertex with itself."""
+    rng = random.Random(seed)
+    vertices = graph.get_vertices()
+    chosen = [(vertices[rng.randrange(VERTICES)], vertices[-1])]
+    chosen += [(vertices[0], vertices[0])]
+    chosen += [
+        (vertices[rng.randrange(VERTICES)], vertices[rng.randrange(VERTICES)])
+        for _ in range(40)
+    ]
+
+    return chosen
+
+def path_to(state, start, target) -> list:
+    """Walks the predecessors back from the target and returns the path from the start."""
+    path = [target]
+
+    while path[-1] is not start:
+        parent = state.get_predecessor(path[-1])
+        assert parent is not None and len(path) <= VERTICES
+        path.append(parent)
+
+    return path[::-1]
+
+def lightest_edge(source, destination) -> int:
+    """Returns the weight of the lightest of the parallel edges between two vertices."""
+    return min(
+        edge.get_weight() for edge in source.get_edges()
+        if edge.get_destination() is destination
+    )
+
+@pytest.mark.parametrize('seed', range(10))
+def test_bidirectional_bfs(seed: int):
+    graph = build_graph(seed, BreadthFirstSearch(integer_ids=True))
+
+    for start, target in pairs(seed, graph):
+        expected = graph.search(start).get_distance(target)
+        state = graph.search(start, target=target, method='bidirectional')
+
+        assert state.get_distance(target) == expected, (start, target)
+
+        if expected != float('inf'):
+            path = path_to(state, start, target)
+
+            assert len(path) - 1 == expected
+            assert all(a.has_edge_to(b) for a, b in zip(path, path[1:]))
+
+@pytest.mark.parametrize('seed', range(10))
+def test_bidirectional_dijkstra(seed: int):
+    graph = build_graph(seed, DijkstraSearch(integer_ids=True))
+
+    for start, target in pairs(seed, graph):
+        expected = graph.search(start, method='heap').get_distance(target)
+        state = graph.search(start, target=target, method='bidirectional')
+
+        assert state.get_distance(target) == expected, (start, target)
+
+        if expected != float('inf'):
+            path = path_to(state, start, target)
+
+            assert sum(lightest_edge(a, b) for a, b in zip(path, path[1:])) == expected
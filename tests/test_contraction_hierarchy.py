@@ -0,0 +1,102 @@
+"""Checks contraction hierarchy queries against DijkstraSearch.run."""
+
+import random
+
+import pytest
+
+from tools.algorithms.contraction_hierarchy import ContractionHierarchy
+from tools.algorithms.dijkstra import DijkstraSearch
+from tools.api.generators import erdos_renyi, to_graph
+
+VERTICES = 40
+
+def build_graph(seed: int) -> DijkstraSearch:
+    """
+    Returns a sparse random directed graph with unreachable pairs, parallel edges and
+    an isolated last vertex.
+    """
+    rng = random.Random(seed)
+    edges = list(erdos_renyi(VERTICES - 1, 60, seed, 9))
+    edges += [
+        (source, destination, rng.randint(1, 9))
+        for source, destination, _ in rng.sample(edges, 10)
+    ]
+
+    return to_graph(VERTICES, edges, DijkstraSearch(integer_ids=True))
+
+def expected_distances(graph: DijkstraSearch) -> list[list[int | float]]:
+    """Returns the distance between every pair of vertices from a full Dijkstra run."""
+    vertices = graph.get_vertices()
+    rows = []
+
+    for source in vertices:
+        state = graph.run(source)
+        rows.append([state.get_distance(target) for target in vertices])
+
+    return rows
+
+def lightest_edge(graph: DijkstraSearch, source: int, destination: int) -> int:
+    """Returns the weight of the lightest of the parallel edges between two vertices."""
+    vertices = graph.get_vertices()
+
+    return min(
+        edge.get_weight() for edge in vertices[source].get_edges()
+        if edge.get_destination() is vertices[destination]
+    )
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('settle_limit', [1, 500])
+def test_distances_match_dijkstra(seed, settle_limit):
+    graph = build_graph(seed)
+    hierarchy = ContractionHierarchy.build(graph, settle_limit=settle_limit)
+    expected = expected_distances(graph)
+
+    assert any(float('inf') in row for row in expected)
+
+    for source in range(VERTICES):
+        for target in range(VERTICES):
+            assert hierarchy.distance(source, target) == expected[source][target]
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('settle_limit', [1, 500])
+def test_paths_unpack_to_shortest_paths(seed, settle_limit):
+    graph = build_graph(seed)
+    hierarchy = ContractionHierarchy.build(graph, settle_limit=settle_limit)
+    expected = expected_distances(graph)
+
+    for source in range(VERTICES):
+        for target in range(VERTICES):
+            path = hierarchy.path(source, target)
+
+            if expected[source][target] == float('inf'):
+                assert path == []
+                continue
+
+            length = sum(lightest_edge(graph, a, b) for a, b in zip(path, path[1:]))
+
+            assert path[0] == source and path[-1] == target
+            assert length == expected[source][target]
+
+def test_save_load_round_trip(tmp_path):
+    graph = build_graph(0)
+    hierarchy = ContractionHierarchy.build(graph)
+    path = str(tmp_path / 'graph.ch')
+
+    hierarchy.save(path)
+    loaded = ContractionHierarchy.load(path)
+
+    assert loaded.vertex_count() == hierarchy.vertex_count()
+
+    for source in range(VERTICES):
+        assert loaded.get_rank(source) == hierarchy.get_rank(source)
+
+        for target in range(VERTICES):
+            assert loaded.distance(source, target) == hierarchy.distance(source, target)
+            assert loaded.path(source, target) == hierarchy.path(source, target)
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / 'graph.ch'
+    path.write_bytes(b'not a hierarchy' * 4)
+
+    with pytest.raises(ValueError):
+        ContractionHierarchy.load(str(path))
@@ -0,0 +1,80 @@
+"""Checks the bucket-based Dijkstra methods against the binary heap."""
+
+import random
+
+import pytest
+
+from tools.algorithms.dijkstra import DIAL_LIMIT, DijkstraSearch
+from tools.api.generators import erdos_renyi, to_graph
+
+VERTICES = 200
+
+def build_graph(seed: int, max_weight: int) -> DijkstraSearch:
+    """Returns a random directed graph with some unreachable vertices and parallel edges."""
+    rng = random.Random(seed)
+    edges = list(erdos_renyi(VERTICES - 5, 3 * VERTICES, seed, max_weight))
+    edges += [
+        (source, destination, rng.randint(1, max_weight))
+        for source, destination, _ in rng.sample(edges, 20)
+    ]
+
+    return to_graph(VERTICES, edges, DijkstraSearch(integer_ids=True))
+
+@pytest.mark.parametrize('max_weight', [1, 7, DIAL_LIMIT, 10_000])
+@pytest.mark.parametrize('seed', range(5))
+def test_methods_match_heap(seed: int, max_weight: int):
+    graph = build_graph(seed, max_weight)
+    vertices = graph.get_vertices()
+    start = vertices[random.Random(seed).randrange(VERTICES)]
+    expected = graph.search(start, method='heap')
+
+    for method in ('dial', 'radix', 'auto'):
+        state = graph.search(start, method=method)
+
+        for vertex in vertices:
+            assert state.get_distance(vertex) == expected.get_distance(vertex), method
+
+            parent = state.get_predecessor(vertex)
+
+            if parent is not None:
+                weight = min(
+                    edge.get_weight() for edge in parent.get_edges()
+                    if edge.get_destination() is vertex
+                )
+                assert state.get_distance(parent) + weight == state.get_distance(vertex)
+
+def test_float_weights_are_rejected():
+    graph = DijkstraSearch()
+    graph.add_vertices_from(['A', 'B'])
+    source, destination = graph.get_vertex('A'), graph.get_vertex('B')
+
+    assert graph.add_edge(source, destination, (1.5, 2.5)) == 0
+    assert graph.add_edge(source, destination, (1, 2.5)) == 0
+    assert not graph.has_edge(source, destination)
+    assert graph.run(source).get_distance(destination) == float('inf')
+
+    assert graph.add_edge(source, destination, (2, 3)) == 2
+    assert graph.run(source, method='dial').get_distance(destination) == 2
+
+@pytest.mark.parametrize('seed', range(5))
+def test_acyclic_hint(seed: int):
+    graph = build_graph(seed, 7)
+    vertices = graph.get_vertices()
+    acyclic = to_graph(
+        VERTICES,
+        ((min(s, d), max(s, d), w) for s, d, w in erdos_renyi(VERTICES, 600, seed, 7) if s != d),
+        DijkstraSearch(integer_ids=True)
+    )
+    graph.set_acyclic_hint(True)
+    acyclic.set_acyclic_hint(True)
+
+    with pytest.raises(ValueError):
+        graph.search(vertices[0], method='dag')
+
+    for search in (graph, acyclic):
+        start = search.get_vertices()[0]
+        expected = search.search(start, method='heap')
+        state = search.run(start)
+
+        assert [state.get_distance(v) for v in search.get_vertices()] == \
+            [expected.get_distance(v) for v in search.get_vertices()]
@@ -0,0 +1,83 @@
+"""Checks the in-place repair of DijkstraSearch.run against fresh heap searches."""
+
+import random
+
+import pytest
+
+from tools.algorithms.dijkstra import DijkstraSearch
+from tools.api.generators import erdos_renyi, to_graph
+
+VERTICES = 150
+STEPS = 100
+
+def update(graph: DijkstraSearch, rng: random.Random):
+    """
+    Applies one random change to the graph: adding an integer or tuple weighted edge,
+    lowering a weight or raising one.
+    """
+    vertices = graph.get_vertices()
+    source = vertices[rng.randrange(VERTICES)]
+    destination = vertices[rng.randrange(VERTICES)]
+    draw = rng.random()
+
+    if draw < 0.5:
+        graph.add_edge(source, destination, rng.randint(1, 30))
+    elif draw < 0.6:
+        graph.add_edge(source, destination, (rng.randint(1, 30), rng.randint(1, 30)))
+    elif source.get_edges():
+        edge = source.get_edges()[0]
+
+        if draw < 0.9:
+            weight = max(1, edge.get_weight() - rng.randint(0, 5))
+        else:
+            weight = edge.get_weight() + 3
+
+        graph.set_weight(source, edge.get_destination(), weight)
+
+def build_graph(seed: int) -> DijkstraSearch:
+    """Returns a random directed graph with small or large weights depending on the seed."""
+    return to_graph(
+        VERTICES, erdos_renyi(VERTICES, 300, seed, [3, 30][seed % 2]),
+        DijkstraSearch(integer_ids=True)
+    )
+
+@pytest.mark.parametrize('seed', range(30))
+def test_repair_matches_fresh_search(seed: int):
+    rng = random.Random(seed)
+    graph = build_graph(seed)
+    vertices = graph.get_vertices()
+    start = vertices[rng.randrange(VERTICES)]
+    previous = graph.run(start)
+    distances = [previous.get_distance(v) for v in vertices]
+
+    for step in range(STEPS):
+        update(graph, rng)
+        repaired = graph.run(start)
+        expected = graph.search(start, method='heap')
+
+        assert repaired is not previous, step
+        assert [previous.get_distance(v) for v in vertices] == distances, step
+        assert [repaired.get_distance(v) for v in vertices] == \
+            [expected.get_distance(v) for v in vertices], step
+        assert [repaired.get_predecessor(v) for v in vertices] == \
+            [expected.get_predecessor(v) for v in vertices], step
+
+        previous = repaired
+        distances = [previous.get_distance(v) for v in vertices]
+
+def test_run_honours_method_and_workspace():
+    graph = build_graph(0)
+    start = graph.get_vertices()[0]
+    first = graph.run(start)
+    workspace = graph.search(start)
+
+    assert graph.run(start, workspace=workspace) is workspace
+    assert graph.run(start, method='scan') is not first
+
+    last = graph.run(start)
+    vertex = graph.get_vertices()[-1]
+    distance = last.get_distance(vertex)
+    graph.add_edge(start, vertex, 1)
+
+    assert last.get_distance(vertex) == distance
+    assert graph.run(start).get_distance(vertex) == 1
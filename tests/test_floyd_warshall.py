@@ -0,0 +1,69 @@
+"""Checks the all-pairs engines against one DijkstraSearch.run per source."""
+
+import random
+
+import pytest
+
+from tools.algorithms import floyd_warshall as engine
+from tools.algorithms.dijkstra import DijkstraSearch
+from tools.api.generators import erdos_renyi, to_graph
+
+def build_graph(seed: int, size: int) -> DijkstraSearch:
+    """
+    Returns a random directed graph with parallel edges and unreachable pairs, whose last
+    vertices are isolated.
+    """
+    rng = random.Random(seed)
+    linked = max(1, size - 3)
+    edges = list(erdos_renyi(linked, 2 * linked, seed, 20)) if linked > 1 else []
+    edges += [
+        (source, destination, rng.randint(1, 20))
+        for source, destination, _ in rng.sample(edges, min(len(edges), 10))
+    ]
+
+    return to_graph(size, edges, DijkstraSearch(integer_ids=True))
+
+def lightest_edge(graph: DijkstraSearch, source: int, destination: int) -> int:
+    """Returns the weight of the lightest of the parallel edges between two vertices."""
+    vertices = graph.get_vertices()
+    return min(
+        edge.get_weight() for edge in vertices[source].get_edges()
+        if edge.get_destination() is vertices[destination]
+    )
+
+def check(graph: DijkstraSearch, distance, next_hop):
+    """Compares both matrices with a full Dijkstra run from every vertex."""
+    vertices = graph.get_vertices()
+
+    for source, vertex in enumerate(vertices):
+        state = graph.run(vertex)
+
+        for target, other in enumerate(vertices):
+            expected = state.get_distance(other)
+            path = engine.extract_path(next_hop, source, target)
+
+            assert distance[source, target] == expected, (source, target)
+
+            if expected == float('inf'):
+                assert path == [], (source, target)
+                continue
+
+            assert path[0] == source and path[-1] == target, (source, target)
+            assert sum(lightest_edge(graph, a, b) for a, b in zip(path, path[1:])) == expected
+
+@pytest.mark.parametrize('size', [1, 2, 37, 64, 100, 150])
+@pytest.mark.parametrize('seed', range(2))
+def test_floyd_warshall_matches_dijkstra(monkeypatch, seed: int, size: int):
+    monkeypatch.setattr(engine, 'TILE_BYTES', 16 * size * 7)
+    graph = build_graph(seed, size)
+    weights = engine.dense_weights(graph.freeze())
+
+    for block in (engine.BLOCK, 16):
+        check(graph, *engine.floyd_warshall(weights, block))
+
+@pytest.mark.parametrize('size', [1, 37, 100])
+def test_all_pairs_methods_match_dijkstra(size: int):
+    graph = build_graph(size, size)
+
+    for method in ('floyd_warshall', 'dijkstra'):
+        check(graph, *graph.all_pairs(method, workers=1))
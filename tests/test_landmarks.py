@@ -0,0 +1,44 @@
+"""Checks landmark selection and the ALT bounds against DijkstraSearch.run."""
+
+import pytest
+
+from tools.algorithms.dijkstra import DijkstraSearch
+from tools.algorithms.landmarks import LandmarkTable
+from tools.api.generators import erdos_renyi, to_graph
+
+COMPONENT = 40
+
+def build_graph(seed: int) -> DijkstraSearch:
+    """Returns two random components of COMPONENT vertices followed by two isolated ones."""
+    edges = list(erdos_renyi(COMPONENT, 160, seed, 9))
+    edges += [
+        (source + COMPONENT, destination + COMPONENT, weight)
+        for source, destination, weight in erdos_renyi(COMPONENT, 160, seed + 1, 9)
+    ]
+
+    return to_graph(2 * COMPONENT + 2, edges, DijkstraSearch(integer_ids=True))
+
+@pytest.mark.parametrize('seed', range(5))
+def test_every_component_gets_a_landmark(seed: int):
+    table = LandmarkTable.build(build_graph(seed), 4, seed)
+    landmarks = table.get_landmarks()
+
+    assert any(landmark < COMPONENT for landmark in landmarks)
+    assert any(COMPONENT <= landmark < 2 * COMPONENT for landmark in landmarks)
+
+@pytest.mark.parametrize('seed', range(5))
+def test_bounds_are_admissible(seed: int):
+    graph = build_graph(seed)
+    table = LandmarkTable.build(graph, 4, seed)
+    vertices = graph.get_vertices()
+
+    for source in vertices[::7]:
+        state = graph.run(source)
+
+        for target in vertices:
+            assert table.lower_bound(source, target) <= state.get_distance(target)
+
+        target = vertices[-3]
+        guided = graph.search(source, target=target, heuristic=table.lower_bound)
+
+        assert guided.get_distance(target) == state.get_distance(target)
@@ -0,0 +1,37 @@
+"""Checks that the edge-list loaders locate malformed lines."""
+
+import re
+
+import pytest
+
+from tools.api.graph import Graph
+from tools.api.loaders import load_csv, load_dimacs, load_snap
+
+def write(tmp_path, name: str, text: str) -> str:
+    """Writes the text to a file in the temporary directory and returns its path."""
+    path = tmp_path / name
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+@pytest.mark.parametrize('loader, name, text, line_number', [
+    (load_snap, 'one_field.txt', '# comment\n0 1\n2\n', 3),
+    (load_snap, 'bad_weight.txt', '0 1 x\n', 1),
+    (load_dimacs, 'short_arc.gr', 'c comment\np sp 3 2\na 1 2\n', 3),
+    (load_dimacs, 'short_problem.gr', 'p sp 3\n', 1),
+    (load_dimacs, 'bad_weight.gr', 'p sp 3 1\na 1 2 heavy\n', 2),
+    (load_csv, 'short_row.csv', '0,1,4\n1\n', 2),
+    (load_csv, 'bad_weight.csv', '0,1,4\n1,2,\n', 2),
+])
+def test_malformed_line_is_located(tmp_path, loader, name, text, line_number):
+    path = write(tmp_path, name, text)
+
+    for graph in (Graph(integer_ids=True), Graph()):
+        with pytest.raises(ValueError, match=f'^{re.escape(path)}:{line_number}: '):
+            loader(graph, path)
+
+def test_well_formed_files_load(tmp_path):
+    graph = Graph(integer_ids=True)
+
+    assert load_snap(graph, write(tmp_path, 'edges.txt', '0 1\n1 2 5\n')).edges == 2
+    assert load_dimacs(graph, write(tmp_path, 'edges.gr', 'p sp 2 1\na 1 2 3\n')).edges == 1
+    assert load_csv(graph, write(tmp_path, 'edges.csv', '0,1,4\n1,2,4\n')).edges == 2
@@ -0,0 +1,56 @@
+"""Checks what happens to earlier results when a vertex is removed from the graph."""
+
+import pytest
+
+from tools.algorithms.breadth_first_search import BreadthFirstSearch
+from tools.algorithms.dijkstra import DijkstraSearch
+from tools.algorithms.landmarks import LandmarkTable
+
+def build_chain(graph: BreadthFirstSearch | DijkstraSearch):
+    """Fills the graph with the chain A -> B -> C -> D."""
+    graph.add_edges_from([('A', 'B', 1), ('B', 'C', 1), ('C', 'D', 1)])
+    return graph
+
+def test_shown_store_follows_the_removal():
+    graph = build_chain(BreadthFirstSearch())
+    state = graph.run(graph.get_vertex('A'))
+    last = graph.get_vertex('D')
+
+    graph.remove_vertex('B')
+
+    assert state.get_distance(last) == 3
+    assert last.get_distance() == 3
+    assert graph.get_vertex('C').get_predecessor().get_label() == 'B'
+
+def test_older_stores_refuse_lookups():
+    graph = build_chain(BreadthFirstSearch())
+    older = graph.run(graph.get_vertex('C'))
+    graph.run(graph.get_vertex('A'))
+
+    graph.remove_vertex('B')
+
+    with pytest.raises(ValueError):
+        older.get_distance(graph.get_vertex('D'))
+
+    assert graph.run(graph.get_vertex('A')).get_distance(graph.get_vertex('D')) == float('inf')
+
+def test_removing_the_last_vertex_keeps_the_layout():
+    graph = build_chain(BreadthFirstSearch())
+    older = graph.run(graph.get_vertex('A'))
+    graph.run(graph.get_vertex('B'))
+
+    graph.remove_vertex('D')
+
+    assert older.get_distance(graph.get_vertex('C')) == 2
+
+def test_landmark_table_refuses_lookups():
+    graph = build_chain(DijkstraSearch())
+    table = LandmarkTable.build(graph, 2)
+    source, target = graph.get_vertex('A'), graph.get_vertex('D')
+
+    assert table.lower_bound(source, target) <= 3
+
+    graph.remove_vertex('B')
+
+    with pytest.raises(ValueError):
+        table.lower_bound(source, target)
@@ -0,0 +1,36 @@
+"""Checks that shortest-path trees keep answering for the graph they were built from."""
+
+from tools.algorithms.breadth_first_search import BreadthFirstSearch
+
+def build_chain() -> BreadthFirstSearch:
+    """Returns the chain A -> B -> C -> D."""
+    graph = BreadthFirstSearch()
+    graph.add_edges_from([('A', 'B', 1), ('B', 'C', 1), ('C', 'D', 1)])
+    return graph
+
+def test_tree_survives_vertex_removal():
+    graph = build_chain()
+    source, last = graph.get_vertex('A'), graph.get_vertex('D')
+    tree = graph.shortest_path_tree(source)
+    path = tree.path_to(last)
+
+    graph.remove_vertex('B')
+
+    assert tree.get_distance(last) == 3
+    assert tree.get_parent(last) is graph.get_vertex('C')
+    assert tree.path_to(last) == path
+    assert [vertex.get_label() for vertex in path] == ['A', 'B', 'C', 'D']
+
+def test_cache_rebuilds_after_vertex_removal():
+    graph = build_chain()
+    source, last = graph.get_vertex('A'), graph.get_vertex('D')
+    tree = graph.shortest_path_tree(source)
+
+    assert graph.shortest_path_tree(source) is tree
+
+    graph.remove_vertex('B')
+    rebuilt = graph.shortest_path_tree(source)
+
+    assert rebuilt is not tree
+    assert rebuilt.get_distance(last) == float('inf')
+    assert rebuilt.path_to(last) == []
@@ -1,21 +1,25 @@
 """A module to perform breadth-first search on a graph."""
 
+from array import array
 from collections import deque
 from matplotlib import pyplot as plt
 
 import networkx as nx
 from networkx import DiGraph
 
+from tools.api.csr import CSRGraph
 from tools.api.graph import Graph
 from tools.api.object import Vertex
+from tools.api.shortest_path_tree import ShortestPathTree, TreeCache
+from tools.api.state import RED, LIGHTBLUE, StateStore
 
 class BreadthFirstSearch(Graph):
     """A class to perform breadth-first search on a graph."""
 
-    def __init__(self):
-        super().__init__()
-        self.__queue: deque['Vertex'] = deque()
+    def __init__(self, deduplicate: bool = False, integer_ids: bool = False):
+        super().__init__(deduplicate, integer_ids)
         self.__is_run: bool = False
+        self.__trees: TreeCache = TreeCache()
         self.__start: Vertex | None = None
 
     def __add_to_graph(
@@ -78,33 +82,205 @@ class BreadthFirstSearch(Graph):
         plt.tight_layout()
         plt.show()
 
-    def run(self, start: Vertex):
-        """Performs breadth-first search starting from the given vertex label."""
-        self._reset('bfs')
-
-        start.update_bfs_attributes(color="red", distance=0)
+    def run(
+            self,
+            start: Vertex,
+            *,
+            target: Vertex | None = None,
+            method: str = 'forward',
+            workspace: StateStore | None = None
+        ) -> StateStore:
+        """
+        Performs breadth-first search starting from the given vertex label and shows the
+        result through the graph's vertices. Every run returns its own store, which later
+        runs leave untouched; a previous result may be passed as workspace to recycle it.
+        """
+        state = self.search(start, workspace, target=target, method=method)
+        self._set_store(state)
 
-        self.__queue.append(start)
         self.__start = start
+        self.__is_run = True
+
+        return state
+
+    def search(
+            self,
+            start: Vertex,
+            workspace: StateStore | None = None,
+            *,
+            target: Vertex | None = None,
+            method: str = 'forward'
+        ) -> StateStore:
+        """
+        Performs breadth-first search starting from the given vertex label.
+        The graph is only read, so several searches may run on it at the same time.
+        A previous result may be passed as workspace to recycle its buffers, which
+        costs O(1) instead of allocating a slot for every vertex.
+
+        Given a target, the search stops as soon as the target is discovered. The method
+        'bidirectional' also searches backward from the target over the reverse adjacency,
+        one level at a time from the smaller frontier, until the two searches meet; only
+        the state along the found path is final then.
+        """
+        state = self._begin_store(workspace)
+
+        state.touch(start._get_position())
+        state.color[start._get_position()] = RED
+        state.distance[start._get_position()] = 0
+
+        match method:
+            case 'forward':
+                self.__search_forward(start, target, state)
+            case 'bidirectional':
+                if target is None:
+                    raise ValueError('The bidirectional method needs a target')
+
+                self.__search_bidirectional(start, target, state)
+            case _:
+                raise ValueError(f'{method} is incorrect value for parameter method')
 
-        while self.__queue:
-            head = self.__queue.popleft()
+        return state
+
+    def __search_forward(self, start: Vertex, target: Vertex | None, state: StateStore):
+        """Discovers the vertices level by level from the start."""
+        color, predecessor, distance = state.color, state.predecessor, state.distance
+        stamp, epoch = state.stamp, state.epoch
+        queue: deque[Vertex] = deque([start])
+
+        if start is target:
+            return
+
+        while queue:
+            head = queue.popleft()
+            position = head._get_position()
 
             for edge in head.get_edges():
                 destination = edge.get_destination()
+                i = destination._get_position()
 
-                if destination.get_color() == 'gray':
-                    destination.update_bfs_attributes(
-                        color='red',
-                        predecessor=head,
-                        distance=head.get_distance() + 1
-                    )
+                if stamp[i] != epoch:
+                    state.touch(i)
+                    color[i] = RED
+                    predecessor[i] = head
+                    distance[i] = distance[position] + 1
+                    queue.append(destination)
 
-                    self.__queue.append(destination)
+                    if destination is target:
+                        return
 
-            head.update_bfs_attributes(color='lightblue')
+            color[position] = LIGHTBLUE
 
-        self.__is_run = True
+    def __search_bidirectional(self, start: Vertex, target: Vertex, state: StateStore):
+        """
+        Expands whole levels of the smaller of the forward and backward frontiers. The
+        first level that reaches a vertex seen by the other side holds the shortest path,
+        and that path is written into the forward state.
+        """
+        vertices = self._get_vertices()
+        reverse = self._get_reverse_edges()
+        color, predecessor, distance = state.color, state.predecessor, state.distance
+        stamp, epoch, touch = state.stamp, state.epoch, state.touch
+        source, sink = start._get_position(), target._get_position()
+        successor: dict[int, int] = {sink: sink}
+        backward: dict[int, int] = {sink: 0}
+        forward_frontier, backward_frontier = [source], [sink]
+        meeting: int | None = source if source == sink else None
+
+        while meeting is None and forward_frontier and backward_frontier:
+            best = float('inf')
+
+            if len(forward_frontier) <= len(backward_frontier):
+                level: list[int] = []
+
+                for position in forward_frontier:
+                    for edge in vertices[position].get_edges():
+                        index = edge.get_destination()._get_position()
+
+                        if stamp[index] != epoch:
+                            touch(index)
+                            color[index] = RED
+                            predecessor[index] = vertices[position]
+                            distance[index] = distance[position] + 1
+                            level.append(index)
+
+                            if index in backward and distance[index] + backward[index] < best:
+                                best = distance[index] + backward[index]
+                                meeting = index
+
+                    color[position] = LIGHTBLUE
+
+                forward_frontier = level
+            else:
+                level = []
+
+                for position in backward_frontier:
+                    for edge in reverse[position]:
+                        index = edge.get_source()._get_position()
+
+                        if index not in backward:
+                            backward[index] = backward[position] + 1
+                            successor[index] = position
+                            level.append(index)
+
+                            if stamp[index] == epoch and distance[index] + backward[index] < best:
+                                best = distance[index] + backward[index]
+                                meeting = index
+
+                backward_frontier = level
+
+        if meeting is None:
+            return
+
+        while meeting != sink:
+            following = successor[meeting]
+            touch(following)
+            color[following] = RED
+            predecessor[following] = vertices[meeting]
+            distance[following] = distance[meeting] + 1
+            meeting = following
+
+    def shortest_path_tree(self, source: Vertex) -> ShortestPathTree:
+        """
+        Returns the breadth-first shortest-path tree of the source as an immutable result.
+        Trees are cached per source until a vertex or an edge is added or removed.
+        """
+        tree = self.__trees.get(self.get_version(), source)
+
+        if tree is None:
+            tree = ShortestPathTree.from_state(self._get_vertices(), source, self.search(source))
+            self.__trees.put(self.get_version(), tree)
+
+        return tree
+
+    @staticmethod
+    def run_frozen(graph: CSRGraph, start: int) -> tuple[array, array]:
+        """
+        Performs breadth-first search on a frozen graph starting from the given vertex id.
+        Returns the distance and predecessor buffers, where -1 marks an unreached vertex.
+        """
+        offsets = graph.get_offsets()
+        targets = graph.get_targets()
+        distance = array('q', [-1]) * graph.vertex_count()
+        predecessor = array('q', [-1]) * graph.vertex_count()
+
+        distance[start] = 0
+        queue = array('q', [start])
+        head = 0
+
+        while head < len(queue):
+            vertex = queue[head]
+            head += 1
+            next_distance = distance[vertex] + 1
+
+            for i in range(offsets[vertex], offsets[vertex + 1]):
+                destination = targets[i]
+
+                if distance[destination] < 0:
+                    distance[destination] = next_distance
+                    predecessor[destination] = vertex
+                    queue.append(destination)
+
+        return distance, predecessor
 
     def get_vertices(self) -> list[Vertex]:
         """Returns the list of vertices in the graph."""
@@ -0,0 +1,399 @@
+"""Module that implements contraction hierarchies for repeated shortest-path queries.
+
+Preprocessing contracts the vertices one at a time, cheapest first, and adds a shortcut
+u -> x whenever contracting v removes the only shortest path u -> v -> x. Every edge then
+leads either up or down the resulting order, and a query only has to search upward from
+the source and upward over the reversed edges from the target.
+
+Layout of a saved hierarchy, every integer little-endian:
+    header          magic b'AADCHIER', version u32, reserved u32,
+                    vertex count u64, upward edge count u64, downward edge count u64
+    rank            vertex count x i64
+    upward          (vertex count + 1) offsets, then targets, weights and middles x i64
+    downward        (vertex count + 1) offsets, then sources, weights and middles x i64
+"""
+
+import struct
+from array import array
+from bisect import bisect_right
+from heapq import heappush, heappop
+
+from tools.api.binary_io import check_size, integers, little_endian, map_file
+from tools.api.csr import CSRGraph
+from tools.api.graph import Graph
+
+MAGIC = b'AADCHIER'
+VERSION = 1
+HEADER = struct.Struct('<8sIIQQQ')
+SETTLE_LIMIT = 500
+
+class ContractionHierarchy:
+    """
+    A class answering shortest-path queries on a static graph from its contraction hierarchy.
+    Vertices are the integer identifiers of the frozen graph, which stay the same whatever
+    happens to the graph later, even when removing a vertex moves another one to its
+    position; map labels to them through the frozen graph. The upward edges of vertex v
+    lead to vertices contracted after v; its downward edges come from such vertices into v.
+    A middle of -1 marks an original edge, any other middle is the vertex a shortcut skips.
+    """
+
+    def __init__(
+            self,
+            rank: array | memoryview,
+            upward: tuple[array | memoryview, ...],
+            downward: tuple[array | memoryview, ...]
+        ):
+        self.__rank = rank
+        self.__up_offsets, self.__up_targets, self.__up_weights, self.__up_middles = upward
+        (
+            self.__down_offsets, self.__down_sources, self.__down_weights, self.__down_middles
+        ) = downward
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the hierarchy."""
+        return (
+            f"ContractionHierarchy(vertices={self.vertex_count()}, "
+            f"edges={len(self.__up_targets) + len(self.__down_sources)})"
+        )
+
+    # -------------------------------------------------------------------------------
+    # List of getter functions to the hierarchy
+    # -------------------------------------------------------------------------------
+
+    def vertex_count(self) -> int:
+        """Returns the number of vertices in the hierarchy."""
+        return len(self.__rank)
+
+    def get_rank(self, vertex_id: int) -> int:
+        """Returns the position of the vertex in the contraction order."""
+        return self.__rank[vertex_id]
+
+    # -------------------------------------------------------------------------------
+    # END
+    # -------------------------------------------------------------------------------
+
+    @classmethod
+    def build(
+            cls,
+            graph: Graph | CSRGraph,
+            settle_limit: int = SETTLE_LIMIT
+        ) -> 'ContractionHierarchy':
+        """
+        Contracts every vertex of the graph in order of edge difference, the number of
+        shortcuts it needs minus the edges it removes, plus the number of its neighbours
+        already contracted. Witness searches settle at most settle_limit vertices, so a
+        lower limit builds faster at the cost of a few unnecessary shortcuts.
+        """
+        csr = graph.freeze() if isinstance(graph, Graph) else graph
+        offsets, targets, weights = csr.get_offsets(), csr.get_targets(), csr.get_weights()
+        size = csr.vertex_count()
+        outgoing: list[dict[int, int]] = [{} for _ in range(size)]
+        incoming: list[dict[int, int]] = [{} for _ in range(size)]
+        middles: dict[tuple[int, int], int] = {}
+
+        for vertex in range(size):
+            for i in range(offsets[vertex], offsets[vertex + 1]):
+                target, weight = targets[i], weights[i]
+
+                if target != vertex and weight < outgoing[vertex].get(target, weight + 1):
+                    outgoing[vertex][target] = weight
+                    incoming[target][vertex] = weight
+
+        contracted_neighbors = array('q', [0]) * size
+        rank = array('q', [0]) * size
+        upward: list[list[tuple[int, int, int]]] = [[] for _ in range(size)]
+        downward: list[list[tuple[int, int, int]]] = [[] for _ in range(size)]
+
+        def shortcuts(vertex: int) -> list[tuple[int, int, int]]:
+            """Returns the shortcuts that contracting the vertex would need."""
+            needed = []
+
+            for source, in_weight in incoming[vertex].items():
+                ends = {target: in_weight + out_weight
+                        for target, out_weight in outgoing[vertex].items() if target != source}
+
+                if not ends:
+                    continue
+
+                witness = cls.__witness(outgoing, source, vertex, ends, settle_limit)
+
+                for target, via in ends.items():
+                    if witness.get(target, via + 1) > via:
+                        needed.append((source, target, via))
+
+            return needed
+
+        def priority(vertex: int, needed: list[tuple[int, int, int]]) -> int:
+            """Returns the cost of contracting the vertex now."""
+            removed = len(incoming[vertex]) + len(outgoing[vertex])
+            return len(needed) - removed + contracted_neighbors[vertex]
+
+        heap = [(priority(vertex, shortcuts(vertex)), vertex) for vertex in range(size)]
+        heap.sort()
+        order = 0
+
+        while heap:
+            _, vertex = heappop(heap)
+            needed = shortcuts(vertex)
+            current = priority(vertex, needed)
+
+            if heap and current > heap[0][0]:
+                heappush(heap, (current, vertex))
+                continue
+
+            for source, target, weight in needed:
+                if weight < outgoing[source].get(target, weight + 1):
+                    outgoing[source][target] = weight
+                    incoming[target][source] = weight
+                    middles[(source, target)] = vertex
+
+            upward[vertex] = [(target, weight, middles.get((vertex, target), -1))
+                              for target, weight in outgoing[vertex].items()]
+            downward[vertex] = [(source, weight, middles.get((source, vertex), -1))
+                                for source, weight in incoming[vertex].items()]
+
+            for target in outgoing[vertex]:
+                del incoming[target][vertex]
+                contracted_neighbors[target] += 1
+
+            for source in incoming[vertex]:
+                del outgoing[source][vertex]
+                contracted_neighbors[source] += 1
+
+            outgoing[vertex], incoming[vertex] = {}, {}
+            rank[vertex] = order
+            order += 1
+
+        return cls(rank, cls.__pack(upward), cls.__pack(downward))
+
+    @staticmethod
+    def __witness(
+            outgoing: list[dict[int, int]],
+            source: int,
+            excluded: int,
+            ends: dict[int, int],
+            settle_limit: int
+        ) -> dict[int, int]:
+        """
+        Runs a bounded Dijkstra search from the source that avoids the excluded vertex and
+        stops once every end is settled, the longest path through the excluded vertex is
+        exceeded, or settle_limit vertices are settled.
+        """
+        limit = max(ends.values())
+        remaining = len(ends)
+        distance = {source: 0}
+        heap = [(0, source)]
+        settled = 0
+
+        while heap and remaining and settled < settle_limit:
+            current_distance, vertex = heappop(heap)
+
+            if current_distance > distance[vertex]:
+                continue
+
+            if current_distance > limit:
+                break
+
+            settled += 1
+
+            if vertex in ends:
+                remaining -= 1
+
+            for target, weight in outgoing[vertex].items():
+                candidate = current_distance + weight
+
+                if target != excluded and candidate < distance.get(target, candidate + 1):
+                    distance[target] = candidate
+                    heappush(heap, (candidate, target))
+
+        return distance
+
+    @staticmethod
+    def __pack(edges: list[list[tuple[int, int, int]]]) -> tuple[array, array, array, array]:
+        """Packs the edge lists of every vertex into offsets, ends, weights and middles."""
+        offsets = array('q', [0])
+        ends, weights, middles = array('q'), array('q'), array('q')
+
+        for vertex_edges in edges:
+            for end, weight, middle in vertex_edges:
+                ends.append(end)
+                weights.append(weight)
+                middles.append(middle)
+
+            offsets.append(len(ends))
+
+        return offsets, ends, weights, middles
+
+    def __search(self, source: int, target: int) -> tuple[int | float, int, dict, dict]:
+        """
+        Searches upward from the source and from the target over the downward edges until
+        neither frontier can improve the best meeting vertex. Returns the distance, the
+        meeting vertex and the edges through which both searches reached their vertices.
+        """
+        up_offsets, up_targets, up_weights = self.__up_offsets, self.__up_targets, self.__up_weights
+        down_offsets, down_sources = self.__down_offsets, self.__down_sources
+        down_weights = self.__down_weights
+        forward: dict[int, int] = {source: 0}
+        backward: dict[int, int] = {target: 0}
+        forward_edges: dict[int, int] = {}
+        backward_edges: dict[int, int] = {}
+        forward_heap = [(0, source)]
+        backward_heap = [(0, target)]
+        best: int | float = float('inf')
+        meeting = -1
+
+        while forward_heap or backward_heap:
+            if forward_heap and (not backward_heap or forward_heap[0][0] <= backward_heap[0][0]):
+                current_distance, vertex = heappop(forward_heap)
+
+                if current_distance >= best:
+                    forward_heap = []
+                    continue
+
+                if current_distance > forward[vertex]:
+                    continue
+
+                if vertex in backward and current_distance + backward[vertex] < best:
+                    best = current_distance + backward[vertex]
+                    meeting = vertex
+
+                for i in range(up_offsets[vertex], up_offsets[vertex + 1]):
+                    end = up_targets[i]
+                    candidate = current_distance + up_weights[i]
+
+                    if candidate < forward.get(end, candidate + 1):
+                        forward[end] = candidate
+                        forward_edges[end] = i
+                        heappush(forward_heap, (candidate, end))
+            else:
+                current_distance, vertex = heappop(backward_heap)
+
+                if current_distance >= best:
+                    backward_heap = []
+                    continue
+
+                if current_distance > backward[vertex]:
+                    continue
+
+                if vertex in forward and forward[vertex] + current_distance < best:
+                    best = forward[vertex] + current_distance
+                    meeting = vertex
+
+                for i in range(down_offsets[vertex], down_offsets[vertex + 1]):
+                    end = down_sources[i]
+                    candidate = current_distance + down_weights[i]
+
+                    if candidate < backward.get(end, candidate + 1):
+                        backward[end] = candidate
+                        backward_edges[end] = i
+                        heappush(backward_heap, (candidate, end))
+
+        return best, meeting, forward_edges, backward_edges
+
+    def distance(self, source: int, target: int) -> int | float:
+        """Returns the length of the shortest path between two vertices, or inf without one."""
+        return self.__search(source, target)[0]
+
+    def path(self, source: int, target: int) -> list[int]:
+        """
+        Returns the vertices of the shortest path between two vertices with every shortcut
+        unpacked, or an empty list when the target cannot be reached.
+        """
+        best, meeting, forward_edges, backward_edges = self.__search(source, target)
+
+        if best == float('inf'):
+            return []
+
+        hops: list[tuple[int, int, int]] = []
+        vertex = meeting
+
+        while vertex != source:
+            i = forward_edges[vertex]
+            previous = bisect_right(self.__up_offsets, i) - 1
+            hops.append((previous, vertex, self.__up_middles[i]))
+            vertex = previous
+
+        hops.reverse()
+        vertex = meeting
+
+        while vertex != target:
+            i = backward_edges[vertex]
+            following = bisect_right(self.__down_offsets, i) - 1
+            hops.append((vertex, following, self.__down_middles[i]))
+            vertex = following
+
+        vertices = [source]
+        stack = hops[::-1]
+
+        while stack:
+            start, end, middle = stack.pop()
+
+            if middle < 0:
+                vertices.append(end)
+                continue
+
+            stack.append((middle, end, self.__up_middles[self.__up_edge(middle, end)]))
+            stack.append((start, middle, self.__down_middles[self.__down_edge(middle, start)]))
+
+        return vertices
+
+    def __up_edge(self, vertex: int, target: int) -> int:
+        """Returns the position of the upward edge from the vertex to the target."""
+        for i in range(self.__up_offsets[vertex], self.__up_offsets[vertex + 1]):
+            if self.__up_targets[i] == target:
+                return i
+
+        raise ValueError(f"No upward edge from {vertex} to {target}")
+
+    def __down_edge(self, vertex: int, source: int) -> int:
+        """Returns the position of the downward edge from the source into the vertex."""
+        for i in range(self.__down_offsets[vertex], self.__down_offsets[vertex + 1]):
+            if self.__down_sources[i] == source:
+                return i
+
+        raise ValueError(f"No downward edge from {source} to {vertex}")
+
+    def save(self, path: str):
+        """Writes the hierarchy to the given path, next to the snapshot of its graph."""
+        with open(path, 'wb') as file:
+            file.write(HEADER.pack(
+                MAGIC, VERSION, 0,
+                self.vertex_count(), len(self.__up_targets), len(self.__down_sources)
+            ))
+
+            for buffer in (
+                self.__rank,
+                self.__up_offsets, self.__up_targets, self.__up_weights, self.__up_middles,
+                self.__down_offsets, self.__down_sources, self.__down_weights, self.__down_middles
+            ):
+                file.write(little_endian(buffer))
+
+    @classmethod
+    def load(cls, path: str) -> 'ContractionHierarchy':
+        """Maps a saved hierarchy into memory without copying its buffers."""
+        buffer = map_file(path)
+
+        if len(buffer) < HEADER.size:
+            raise ValueError(f"{path} is not a contraction hierarchy")
+
+        magic, version, _, vertex_count, up_count, down_count = HEADER.unpack_from(buffer)
+
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a contraction hierarchy")
+
+        if version != VERSION:
+            raise ValueError(f"Unsupported contraction hierarchy version: {version}")
+
+        check_size(buffer, path, HEADER.size, 3 * vertex_count + 2 + 3 * (up_count + down_count))
+
+        rank, position = integers(buffer, HEADER.size, vertex_count)
+        sections = []
+
+        for count in (up_count, down_count):
+            offsets, position = integers(buffer, position, vertex_count + 1)
+            ends, position = integers(buffer, position, count)
+            weights, position = integers(buffer, position, count)
+            middles, position = integers(buffer, position, count)
+            sections.append((offsets, ends, weights, middles))
+
+        return cls(rank, sections[0], sections[1])
@@ -1,19 +1,23 @@
 """A module to perform depth-first search on a graph."""
 
+from array import array
+from typing import Iterator
+
 from matplotlib import pyplot as plt
 
 import networkx as nx
 from networkx import DiGraph
 
+from tools.api.csr import CSRGraph
 from tools.api.graph import Graph
-from tools.api.object import Vertex
+from tools.api.object import Vertex, Edge
+from tools.api.state import RED, LIGHTBLUE, StateStore
 
 class DepthFirstSearch(Graph):
     """A class to perform depth-first search on a graph."""
 
-    def __init__(self):
-        super().__init__()
-        self.__time = 0
+    def __init__(self, deduplicate: bool = False, integer_ids: bool = False):
+        super().__init__(deduplicate, integer_ids)
         self.__is_run: bool = False
         self.__start: Vertex | None = None
 
@@ -86,47 +90,121 @@ class DepthFirstSearch(Graph):
         plt.tight_layout()
         plt.show()
 
-    def run(self, start: Vertex):
-        """Performs depth-first search starting from the given vertex label."""
-        self._reset('dfs')
-        self.__dfs_visit(start)
+    def run(self, start: Vertex, *, workspace: StateStore | None = None) -> StateStore:
+        """
+        Performs depth-first search starting from the given vertex label and shows the
+        result through the graph's vertices. Every run returns its own store, which later
+        runs leave untouched; a previous result may be passed as workspace to recycle it.
+        """
+        state = self.search(start, workspace)
+        self._set_store(state)
+
         self.__start = start
         self.__is_run = True
 
-    def __dfs_visit(self, vertex: Vertex):
-        """Visits a vertex and explores its neighbors recursively."""
-        self.__time += 1
-
-        vertex.update_dfs_attributes(color="red", discovery_time=self.__time)
-
-        if len(vertex.get_edges()) < 1:
-            self.__update_isolated_vertices(vertex)
-            return
-
-        for edge in vertex.get_edges():
-            if edge.get_destination().get_color() == 'gray':
-                edge.update_dfs_attributes(classification='T')
-                edge.get_destination().update_dfs_attributes(predecessor=vertex)
-                self.__dfs_visit(edge.get_destination())
+        return state
+
+    def search(self, start: Vertex, workspace: StateStore | None = None) -> StateStore:
+        """
+        Performs depth-first search starting from the given vertex label.
+        The graph is only read, so several searches may run on it at the same time.
+        A previous result may be passed as workspace to recycle its buffers, which
+        costs O(1) instead of allocating a slot for every vertex.
+        """
+        state = self._begin_store(workspace)
+        color, predecessor = state.color, state.predecessor
+        discovery_time, finish_time = state.discovery_time, state.finish_time
+        classification = state.classification
+        stamp, epoch = state.stamp, state.epoch
+
+        time = 1
+        state.touch(start._get_position())
+        color[start._get_position()] = RED
+        discovery_time[start._get_position()] = time
+        stack: list[tuple[Vertex, Iterator[Edge]]] = [(start, iter(start.get_edges()))]
+
+        while stack:
+            vertex, edges = stack[-1]
+            edge = next(edges, None)
+
+            if edge is None:
+                stack.pop()
+                time += 1
+                color[vertex._get_position()] = LIGHTBLUE
+                finish_time[vertex._get_position()] = time
+                continue
+
+            destination = edge.get_destination()
+            i = destination._get_position()
+
+            if stamp[i] != epoch:
+                state.touch(i)
+                classification[edge] = 'T'
+                predecessor[i] = vertex
+                time += 1
+                color[i] = RED
+                discovery_time[i] = time
+                stack.append((destination, iter(destination.get_edges())))
+
+            elif color[i] == RED:
+                classification[edge] = 'B'
+
+            elif discovery_time[vertex._get_position()] < discovery_time[i]:
+                classification[edge] = 'F'
 
-            elif edge.get_destination().get_color() == 'red':
-                edge.update_dfs_attributes(classification='B')
-
-            elif edge.get_destination().get_color() == 'lightblue':
-                source_time = vertex.get_discovery_time()
-                destination_time = edge.get_destination().get_discovery_time()
-
-                if source_time < destination_time:
-                    edge.update_dfs_attributes(classification='F')
-                else:
-                    edge.update_dfs_attributes(classification='C')
-
-        self.__update_isolated_vertices(vertex)
+            else:
+                classification[edge] = 'C'
+
+        return state
+
+    @staticmethod
+    def run_frozen(graph: CSRGraph, start: int) -> tuple[array, array, array, bytearray]:
+        """
+        Performs depth-first search on a frozen graph starting from the given vertex id.
+        Returns the discovery, finish and predecessor buffers along with the classification
+        of every edge as an ASCII code ('T', 'B', 'F', 'C' or a space when never reached).
+        """
+        offsets = graph.get_offsets()
+        targets = graph.get_targets()
+        discovery = array('q', [0]) * graph.vertex_count()
+        finish = array('q', [0]) * graph.vertex_count()
+        predecessor = array('q', [-1]) * graph.vertex_count()
+        classification = bytearray(b' ') * graph.edge_count()
+
+        time = 1
+        discovery[start] = time
+        stack = array('q', [start])
+        cursor = array('q', [offsets[start]])
+
+        while stack:
+            vertex = stack[-1]
+            i = cursor[-1]
+
+            if i == offsets[vertex + 1]:
+                stack.pop()
+                cursor.pop()
+                time += 1
+                finish[vertex] = time
+                continue
+
+            cursor[-1] = i + 1
+            destination = targets[i]
+
+            if discovery[destination] == 0:
+                classification[i] = 84
+                predecessor[destination] = vertex
+                time += 1
+                discovery[destination] = time
+                stack.append(destination)
+                cursor.append(offsets[destination])
+            elif finish[destination] == 0:
+                classification[i] = 66
+            elif discovery[vertex] < discovery[destination]:
+                classification[i] = 70
+            else:
+                classification[i] = 67
 
-    def __update_isolated_vertices(self, vertex: Vertex):
-        """Updates the attributes of isolated vertices."""
-        self.__time += 1
-        vertex.update_dfs_attributes(color='lightblue', finish_time=self.__time)
+        return discovery, finish, predecessor, classification
 
     def get_vertices(self) -> list[Vertex]:
         """Returns the list of vertices in the graph."""
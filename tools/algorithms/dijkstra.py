@@ -1,22 +1,82 @@
 """Module that implements Dijkstra's algorithm using existing Graph structure."""
 
+import os
+from array import array
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from heapq import heappush, heappop
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Iterable
 
+import numpy as np
 from matplotlib import pyplot as plt
 
 import networkx as nx
 from networkx import MultiDiGraph
 
+from tools.algorithms.floyd_warshall import dense_weights, floyd_warshall, next_hops
+from tools.algorithms.heuristics import Heuristic
+from tools.api.csr import CSRGraph
 from tools.api.graph import Graph
-from tools.api.object import Vertex
+from tools.api.object import Vertex, Edge
+from tools.api.shared import SharedGraph
+from tools.api.shortest_path_tree import ShortestPathTree, TreeCache
+from tools.api.state import StateStore
+
+DIAL_LIMIT = 256
+FLOYD_LIMIT = 4096
+FLOYD_DENSITY = 0.01
+
+_WORKER: dict[str, object] = {}
+
+def _open_matrix(
+        spec: tuple[str, str, tuple[int, int], str]
+    ) -> tuple[np.ndarray, SharedMemory | None]:
+    """Opens a result matrix described by its kind, location, shape and dtype."""
+    kind, location, shape, dtype = spec
+
+    if kind == 'file':
+        return np.load(location, mmap_mode='r+'), None
+
+    block = SharedMemory(name=location)
+    return np.ndarray(shape, dtype=dtype, buffer=block.buf), block
+
+def _attach_worker(graph_handle: tuple[str, int, int], specs: tuple[tuple, tuple]):
+    """Attaches a worker process to the shared graph and the shared result matrices."""
+    block, graph = SharedGraph.attach(graph_handle)
+    (distance, distance_block), (predecessor, predecessor_block) = map(_open_matrix, specs)
+    _WORKER.update(
+        graph=graph, distance=distance, predecessor=predecessor,
+        blocks=(block, distance_block, predecessor_block)
+    )
+
+def _fill_rows(rows: list[tuple[int, int]]):
+    """Writes the distance and predecessor rows of the given sources into the matrices."""
+    _fill(_WORKER['graph'], _WORKER['distance'], _WORKER['predecessor'], rows)
+
+def _fill(
+        graph: CSRGraph,
+        distance: np.ndarray,
+        predecessor: np.ndarray,
+        rows: list[tuple[int, int]]
+    ):
+    """Runs the frozen search from every source and stores it in its row."""
+    for row, source in rows:
+        distances, predecessors = DijkstraSearch.run_frozen(graph, source)
+        distance[row] = np.frombuffer(distances, dtype=np.float64)
+        predecessor[row] = np.frombuffer(predecessors, dtype=np.int64)
 
 class DijkstraSearch(Graph):
     """A class to perform Dijkstra search on a graph"""
 
-    def __init__(self):
-        super().__init__()
-        self.__queue: deque['Vertex'] = deque()
+    def __init__(self, deduplicate: bool = False, integer_ids: bool = False):
+        super().__init__(deduplicate, integer_ids)
         self.__is_run: bool = False
+        self.__trees: TreeCache = TreeCache()
+        self.__live: StateStore | None = None
+        self.__shared: bool = False
+        self.__settled: tuple[int, int, int] | None = None
+        self.__acyclic: bool = False
 
     def __add_to_graph(
             self,
@@ -91,45 +151,852 @@ class DijkstraSearch(Graph):
         plt.tight_layout()
         plt.show()
 
-    def run(self, start: Vertex):
-        """Performs Dijkstra search starting from the given vertex label."""
-        self._reset('dijkstra')
+    def run(
+            self,
+            start: Vertex,
+            *,
+            method: str = 'auto',
+            target: Vertex | None = None,
+            targets: Iterable[Vertex] | None = None,
+            heuristic: Heuristic | None = None,
+            workspace: StateStore | None = None
+        ) -> StateStore:
+        """
+        Performs Dijkstra search starting from the given vertex label and shows the result
+        through the graph's vertices. Every run returns its own store, which later runs
+        leave untouched; a previous result may be passed as workspace to recycle it.
+
+        The search object also keeps the state of the last full run: adding an edge or
+        lowering a weight repairs it, copying it first if it was handed out, so running
+        again from the same start with the default method and no workspace returns a copy
+        of it without searching.
+        """
+        full = target is None and targets is None and method != 'bidirectional'
+        position = start._get_position()
+
+        if full and method == 'auto' and workspace is None and self.__is_settled(position):
+            state = self.__live.copy()
+        else:
+            state = self.search(
+                start, workspace, method=method, target=target, targets=targets, heuristic=heuristic
+            )
+
+            if full:
+                self.__live, self.__shared = state, True
+                self.__settled = (position, self.get_version(), state.epoch)
+
+        self._set_store(state)
+        self.__is_run = True
+
+        return state
+
+    def add_edge(
+            self,
+            source: Vertex,
+            destination: Vertex,
+            weight: int | tuple[int, int] = 1
+        ) -> int:
+        """Adds an edge between two vertices and repairs the state of the last full run."""
+        current = self.__is_settled()
+        count = (len(source.get_edges()), len(destination.get_edges()))
+        added = super().add_edge(source, destination, weight)
+        edges = source.get_edges()[count[0]:]
+
+        if destination is not source:
+            edges = edges + destination.get_edges()[count[1]:]
+
+        if current:
+            self.__repair(edges)
+
+        return added
+
+    def set_weight(self, source: Vertex, destination: Vertex, weight: int) -> bool:
+        """
+        Changes the weight of the first edge from the source to the destination. Lowering
+        it repairs the state of the last full run; raising it means the next run is full.
+        """
+        edge = source.get_edge_to(destination)
+        lowered = edge is not None and isinstance(weight, int) and weight <= edge.get_weight()
+        current = lowered and self.__is_settled()
+        changed = super().set_weight(source, destination, weight)
+
+        if changed and current and edge is not None:
+            self.__repair([edge])
+
+        return changed
+
+    def __is_settled(self, position: int | None = None) -> bool:
+        """
+        Checks if the kept state still holds a full run of the current graph, from the
+        vertex at the given position when one is given.
+        """
+        if self.__settled is None or self.__live is None:
+            return False
+
+        if position is not None and self.__settled[0] != position:
+            return False
+
+        return self.__settled[1:] == (self.get_version(), self.__live.epoch)
+
+    def __repair(self, edges: list[Edge]):
+        """
+        Propagates the new or lowered edges through the state of the last full run, in the
+        style of Ramalingam and Reps: only the vertices whose distance drops are settled
+        again, in order of their new distance. Predecessors are then recomputed for those
+        vertices and for the vertices the new edges make tight, as the last tight in-edge
+        in settle order, which is the predecessor a full run would pick.
+        """
+        if self.__shared:
+            self.__live, self.__shared = self.__live.copy(), False
+
+        vertices = self._get_vertices()
+        reverse = self._get_reverse_edges()
+        state = self.__live
+        predecessor, distance = state.predecessor, state.distance
+        stamp, epoch, touch = state.stamp, state.epoch, state.touch
+        heap: list[tuple[float, int]] = []
+        affected: set[int] = set()
+
+        for edge in edges:
+            source = edge.get_source()._get_position()
+            index = edge.get_destination()._get_position()
+            touch(source)
+            touch(index)
+            candidate = distance[source] + edge.get_weight()
+
+            if candidate == float('inf'):
+                continue
+
+            if candidate <= distance[index]:
+                affected.add(index)
+
+                if candidate < distance[index]:
+                    distance[index] = candidate
+                    heappush(heap, (candidate, index))
+
+        while heap:
+            current_distance, position = heappop(heap)
+
+            if current_distance > distance[position]:
+                continue
+
+            for edge in vertices[position].get_edges():
+                index = edge.get_destination()._get_position()
+                candidate = current_distance + edge.get_weight()
+
+                if stamp[index] != epoch:
+                    touch(index)
+
+                if candidate <= distance[index]:
+                    affected.add(index)
+
+                    if candidate < distance[index]:
+                        distance[index] = candidate
+                        heappush(heap, (candidate, index))
+
+        for position in affected:
+            parent: Vertex | None = None
+            key = (float('-inf'), -1)
+
+            for edge in reverse[position]:
+                source = edge.get_source()._get_position()
+
+                if stamp[source] != epoch:
+                    continue
+
+                if distance[source] + edge.get_weight() == distance[position]:
+                    if (distance[source], source) > key:
+                        key = (distance[source], source)
+                        parent = vertices[source]
+
+            predecessor[position] = parent
+
+        self.__settled = (self.__settled[0], self.get_version(), epoch)
+
+    def search(
+            self,
+            start: Vertex,
+            workspace: StateStore | None = None,
+            *,
+            method: str = 'auto',
+            target: Vertex | None = None,
+            targets: Iterable[Vertex] | None = None,
+            heuristic: Heuristic | None = None
+        ) -> StateStore:
+        """
+        Performs Dijkstra search starting from the given vertex label.
+        The graph is only read, so several searches may run on it at the same time.
+        A previous result may be passed as workspace to recycle its buffers, which
+        costs O(1) instead of allocating a slot for every vertex.
+
+        The method 'heap' keeps the frontier in a binary heap with lazy deletion and runs
+        in O((V + E) log V); 'scan' is the original O(V^2) linear scan, kept for comparison.
+        As weights are small positive integers, 'dial' keeps one bucket per distance in a
+        ring of max weight + 1 buckets and runs in O(V + E + D) for a largest distance D,
+        while 'radix' files distances by their highest bit differing from the last settled
+        one and runs in O(E + V log C) for a max weight C. The method 'dag' relaxes the edges
+        reachable from the start once in topological order, in linear time without any
+        queue, and raises ValueError on a cycle. The default 'auto' picks 'dag' for a full
+        search on a graph hinted acyclic with set_acyclic_hint, falling back when the start
+        reaches a cycle after all, then 'dial' when the max weight is at most DIAL_LIMIT
+        and 'heap' otherwise, since heapq runs in C and the radix heap does not beat it in
+        CPython.
+        The method 'bidirectional' needs a single target and searches forward from the
+        start and backward from the target over the reverse adjacency until they meet;
+        only the distances and predecessors along the found path are final.
+
+        Given a target or targets, the search stops as soon as all of them are settled, so
+        only their distances and paths are final. A heuristic turns the heap search into
+        A*: vertices are settled in order of distance plus the heuristic's lower bound to
+        the nearest target.
+        """
+        goals = {vertex._get_position() for vertex in targets} if targets is not None else set()
+
+        if target is not None:
+            goals.add(target._get_position())
+
+        if heuristic is not None and not goals:
+            raise ValueError('A heuristic needs a target to estimate the distance to')
+
+        automatic = method == 'auto'
+
+        if automatic:
+            method = self.__choose_method(heuristic, goals)
+
+        if heuristic is not None and method != 'heap':
+            raise ValueError(f'A heuristic is not supported by the {method} method')
+
+        order = self.__topological_order([start]) if method == 'dag' else None
+
+        if method == 'dag' and order is None:
+            if not automatic:
+                raise ValueError('The graph has a cycle')
+
+            method = self.__bucket_method()
+
+        state = self._begin_store(workspace)
+        state.touch(start._get_position())
+        state.distance[start._get_position()] = 0
+
+        match method:
+            case 'heap':
+                self.__search_heap(start, state, goals, heuristic)
+            case 'bidirectional':
+                if target is None or targets is not None:
+                    raise ValueError('The bidirectional method needs exactly one target')
 
-        start.update_dijkstra_attributes(distance=0)
+                self.__search_bidirectional(start, target, state)
+            case 'dag':
+                self.__search_dag(order, state, goals)
+            case 'dial':
+                self.__search_dial(start, state, goals)
+            case 'radix':
+                self.__search_radix(start, state, goals)
+            case 'scan':
+                self.__search_scan(state, goals)
+            case _:
+                raise ValueError(f'{method} is incorrect value for parameter method')
 
-        for vertex in self._get_vertices():
-            self.__queue.append(vertex)
+        return state
 
-        while self.__queue:
-            current_vertex = self.__min_vertex()
+    def __search_heap(
+            self,
+            start: Vertex,
+            state: StateStore,
+            goals: set[int],
+            heuristic: Heuristic | None
+        ):
+        """Settles the vertices in order of distance, popping them from a binary heap."""
+        vertices = self._get_vertices()
+        predecessor, distance = state.predecessor, state.distance
+        stamp, epoch, touch = state.stamp, state.epoch, state.touch
+        estimate = self.__estimate(goals, heuristic)
+        heap: list[tuple[float, float, int]] = [(estimate(start), 0, start._get_position())]
+
+        while heap:
+            _, current_distance, position = heappop(heap)
+
+            if current_distance > distance[position]:
+                continue
+
+            if goals:
+                goals.discard(position)
+
+                if not goals:
+                    break
+
+            current_vertex = vertices[position]
 
             for edge in current_vertex.get_edges():
-                source = edge.get_source()
                 destination = edge.get_destination()
-                weight = edge.get_weight()
+                index = destination._get_position()
+                candidate = current_distance + edge.get_weight()
 
-                if destination.get_distance() >= source.get_distance() + weight:
-                    destination.update_dijkstra_attributes(
-                        predecessor=source,
-                        distance=source.get_distance() + weight
-                    )
+                if stamp[index] != epoch:
+                    touch(index)
 
-        self.__is_run = True
+                if distance[index] >= candidate:
+                    predecessor[index] = current_vertex
+
+                    if distance[index] > candidate:
+                        distance[index] = candidate
+                        heappush(heap, (candidate + estimate(destination), candidate, index))
+
+    def __choose_method(self, heuristic: Heuristic | None, goals: set[int]) -> str:
+        """
+        Returns the fastest method for the graph. A search for targets keeps a queue so it
+        can stop early, so only a full search on a graph hinted acyclic takes 'dag'.
+        """
+        if heuristic is not None:
+            return 'heap'
+
+        if not goals and self.__acyclic:
+            return 'dag'
+
+        return self.__bucket_method()
+
+    def __bucket_method(self) -> str:
+        """Returns 'dial' when the max weight is at most DIAL_LIMIT and 'heap' otherwise."""
+        return 'dial' if self._get_max_weight() <= DIAL_LIMIT else 'heap'
+
+    def set_acyclic_hint(self, acyclic: bool):
+        """
+        Tells the 'auto' method that the graph is acyclic, so full searches relax it in
+        topological order. Acyclicity is not detected on its own, since proving it costs a
+        pass over the whole graph that a search in CPython does not win back. A wrong hint
+        only costs that pass: a search that meets a cycle falls back to 'dial' or 'heap'.
+        """
+        self.__acyclic = acyclic
+
+    def __topological_order(self, starts: Iterable[Vertex]) -> array | None:
+        """
+        Returns the positions of the vertices reachable from the starts in topological
+        order, the reverse of the order a depth-first search finishes them, or None as
+        soon as the search meets a cycle.
+        """
+        vertices = self._get_vertices()
+        mark = bytearray(len(vertices))
+        finished = array('q')
+
+        for start in starts:
+            root = start._get_position()
+
+            if mark[root]:
+                continue
+
+            mark[root] = 1
+            stack = [(root, iter(vertices[root].get_edges()))]
+
+            while stack:
+                position, edges = stack[-1]
+
+                for edge in edges:
+                    index = edge.get_destination()._get_position()
+
+                    if mark[index] == 0:
+                        mark[index] = 1
+                        stack.append((index, iter(vertices[index].get_edges())))
+                        break
+
+                    if mark[index] == 1:
+                        return None
+                else:
+                    stack.pop()
+                    mark[position] = 2
+                    finished.append(position)
+
+        finished.reverse()
+        return finished
+
+    def __acyclic_order(self, starts: Iterable[Vertex]) -> array:
+        """Returns the topological order from the starts, raising ValueError on a cycle."""
+        order = self.__topological_order(starts)
+
+        if order is None:
+            raise ValueError('The graph has a cycle')
+
+        return order
+
+    def __search_dag(self, order: array, state: StateStore, goals: set[int]):
+        """
+        Relaxes the outgoing edges of the vertices reachable from the start, given in
+        topological order, when their distance is already final. A tie keeps the parent that a heap
+        search would keep, the one with the greater distance, or the greater position on
+        equal distances.
+        """
+        vertices = self._get_vertices()
+        predecessor, distance = state.predecessor, state.distance
+        stamp, epoch, touch = state.stamp, state.epoch, state.touch
+
+        for position in order:
+            if goals:
+                goals.discard(position)
+
+                if not goals:
+                    return
+
+            current_vertex = vertices[position]
+            current_distance = distance[position]
+
+            for edge in current_vertex.get_edges():
+                index = edge.get_destination()._get_position()
+                candidate = current_distance + edge.get_weight()
+
+                if stamp[index] != epoch:
+                    touch(index)
+
+                if candidate < distance[index]:
+                    distance[index] = candidate
+                    predecessor[index] = current_vertex
+                elif candidate == distance[index]:
+                    parent = predecessor[index]._get_position()
+
+                    if (current_distance, position) > (distance[parent], parent):
+                        predecessor[index] = current_vertex
 
-    def __min_vertex(self) -> Vertex:
-        """Gets the vertex whose distance is the least in the queue"""
+    def longest_paths(self, start: Vertex, workspace: StateStore | None = None) -> StateStore:
+        """
+        Computes the longest path from the start to every vertex it reaches, in linear time
+        over their topological order. Raises ValueError when the start reaches a cycle.
+        """
+        vertices = self._get_vertices()
+        state = self._begin_store(workspace)
+        predecessor, distance = state.predecessor, state.distance
+        stamp, epoch, touch = state.stamp, state.epoch, state.touch
+
+        touch(start._get_position())
+        distance[start._get_position()] = 0
+
+        for position in self.__acyclic_order([start]):
+            for edge in vertices[position].get_edges():
+                index = edge.get_destination()._get_position()
+                candidate = distance[position] + edge.get_weight()
+
+                if stamp[index] != epoch:
+                    touch(index)
+
+                if distance[index] == float('inf') or candidate > distance[index]:
+                    distance[index] = candidate
+                    predecessor[index] = vertices[position]
+
+        return state
+
+    def critical_path(self) -> tuple[int, list[Vertex]]:
+        """
+        Returns the length and the vertices of the longest path anywhere in an acyclic graph,
+        such as the critical path of a task graph whose edge weights are durations.
+        Raises ValueError on a cycle.
+        """
+        vertices = self._get_vertices()
+        length = array('q', [0]) * len(vertices)
+        parent = array('q', [-1]) * len(vertices)
+
+        for position in self.__acyclic_order(vertices):
+            for edge in vertices[position].get_edges():
+                index = edge.get_destination()._get_position()
+                candidate = length[position] + edge.get_weight()
+
+                if candidate > length[index]:
+                    length[index] = candidate
+                    parent[index] = position
+
+        if not vertices:
+            return 0, []
+
+        end = max(range(len(vertices)), key=length.__getitem__)
+        path = []
+
+        while end >= 0:
+            path.append(vertices[end])
+            end = parent[end]
+
+        path.reverse()
+        return max(length), path
+
+    def __search_dial(self, start: Vertex, state: StateStore, goals: set[int]):
+        """
+        Settles the vertices bucket by bucket. Every reached distance lies within max weight
+        of the current one, so a ring of max weight + 1 buckets holds the whole frontier and
+        each bucket only holds vertices of the current distance when it is reached.
+        """
+        vertices = self._get_vertices()
+        predecessor, distance = state.predecessor, state.distance
+        stamp, epoch, touch = state.stamp, state.epoch, state.touch
+        width = self._get_max_weight() + 1
+        buckets: list[list[int]] = [[] for _ in range(width)]
+        buckets[0].append(start._get_position())
+        pending = 1
+        current_distance = 0
+
+        while pending:
+            slot = current_distance % width
+            bucket = buckets[slot]
+
+            if not bucket:
+                current_distance += 1
+                continue
+
+            buckets[slot] = []
+            pending -= len(bucket)
+            bucket.sort()
+
+            for position in bucket:
+                if distance[position] != current_distance:
+                    continue
+
+                if goals:
+                    goals.discard(position)
+
+                    if not goals:
+                        return
+
+                current_vertex = vertices[position]
+
+                for edge in current_vertex.get_edges():
+                    index = edge.get_destination()._get_position()
+                    candidate = current_distance + edge.get_weight()
+
+                    if stamp[index] != epoch:
+                        touch(index)
+
+                    if distance[index] >= candidate:
+                        predecessor[index] = current_vertex
+
+                        if distance[index] > candidate:
+                            distance[index] = candidate
+                            buckets[candidate % width].append(index)
+                            pending += 1
+
+            current_distance += 1
+
+    def __search_radix(self, start: Vertex, state: StateStore, goals: set[int]):
+        """
+        Settles the vertices from a radix heap. A distance is filed in the bucket of the
+        highest bit in which it differs from the last settled distance; when bucket 0 runs
+        dry, the first non-empty bucket is emptied and refiled against its own minimum, so
+        every entry moves down at most once per bit.
+        """
+        vertices = self._get_vertices()
+        predecessor, distance = state.predecessor, state.distance
+        stamp, epoch, touch = state.stamp, state.epoch, state.touch
+        buckets: list[list[tuple[int, int]]] = [[] for _ in range(65)]
+        buckets[0].append((0, start._get_position()))
+        pending = 1
+        last = 0
+
+        while pending:
+            if not buckets[0]:
+                level = 1
+
+                while not buckets[level]:
+                    level += 1
+
+                entries = buckets[level]
+                buckets[level] = []
+                last = min(entries)[0]
+
+                for entry in entries:
+                    buckets[(entry[0] ^ last).bit_length()].append(entry)
+
+                buckets[0].sort(reverse=True)
+
+            current_distance, position = buckets[0].pop()
+            pending -= 1
+
+            if current_distance > distance[position]:
+                continue
+
+            if goals:
+                goals.discard(position)
+
+                if not goals:
+                    return
+
+            current_vertex = vertices[position]
+
+            for edge in current_vertex.get_edges():
+                index = edge.get_destination()._get_position()
+                candidate = current_distance + edge.get_weight()
+
+                if stamp[index] != epoch:
+                    touch(index)
+
+                if distance[index] >= candidate:
+                    predecessor[index] = current_vertex
+
+                    if distance[index] > candidate:
+                        distance[index] = candidate
+                        buckets[(candidate ^ last).bit_length()].append((candidate, index))
+                        pending += 1
+
+    def __search_bidirectional(self, start: Vertex, target: Vertex, state: StateStore):
+        """
+        Alternates a forward search from the start and a backward search from the target,
+        always advancing the side whose frontier is nearer. The search stops once the two
+        frontiers together are at least as far as the best path through a vertex both have
+        reached, and that path is then written into the forward state.
+        """
+        vertices = self._get_vertices()
+        reverse = self._get_reverse_edges()
+        predecessor, distance = state.predecessor, state.distance
+        stamp, epoch, touch = state.stamp, state.epoch, state.touch
+        source, sink = start._get_position(), target._get_position()
+        backward: dict[int, float] = {sink: 0}
+        successor: dict[int, tuple[int, int]] = {}
+        forward_heap: list[tuple[float, int]] = [(0, source)]
+        backward_heap: list[tuple[float, int]] = [(0, sink)]
+        best = 0 if source == sink else float('inf')
+        meeting = source
+
+        while forward_heap and backward_heap and forward_heap[0][0] + backward_heap[0][0] < best:
+            if forward_heap[0][0] <= backward_heap[0][0]:
+                current_distance, position = heappop(forward_heap)
+
+                if current_distance > distance[position]:
+                    continue
+
+                for edge in vertices[position].get_edges():
+                    index = edge.get_destination()._get_position()
+                    candidate = current_distance + edge.get_weight()
+
+                    if stamp[index] != epoch:
+                        touch(index)
+
+                    if candidate < distance[index]:
+                        distance[index] = candidate
+                        predecessor[index] = vertices[position]
+                        heappush(forward_heap, (candidate, index))
+
+                    if index in backward and candidate + backward[index] < best:
+                        best = candidate + backward[index]
+                        meeting = index
+            else:
+                current_distance, position = heappop(backward_heap)
+
+                if current_distance > backward[position]:
+                    continue
+
+                for edge in reverse[position]:
+                    index = edge.get_source()._get_position()
+                    candidate = current_distance + edge.get_weight()
+
+                    if candidate < backward.get(index, float('inf')):
+                        backward[index] = candidate
+                        successor[index] = (position, edge.get_weight())
+                        heappush(backward_heap, (candidate, index))
+
+                    if stamp[index] == epoch and distance[index] + candidate < best:
+                        best = distance[index] + candidate
+                        meeting = index
+
+        if best == float('inf'):
+            return
+
+        while meeting != sink:
+            following, weight = successor[meeting]
+            touch(following)
+            distance[following] = distance[meeting] + weight
+            predecessor[following] = vertices[meeting]
+            meeting = following
+
+    def __estimate(self, goals: set[int], heuristic: Heuristic | None) -> Callable[[Vertex], float]:
+        """Returns the lower bound of the distance from a vertex to its nearest goal."""
+        if heuristic is None:
+            return lambda vertex: 0
+
+        vertices = self._get_vertices()
+        ends = [vertices[position] for position in goals]
+
+        if len(ends) == 1:
+            end = ends[0]
+            return lambda vertex: heuristic(vertex, end)
+
+        return lambda vertex: min(heuristic(vertex, end) for end in ends)
+
+    def __search_scan(self, state: StateStore, goals: set[int]):
+        """Settles the vertices in order of distance, scanning a queue of all of them."""
+        predecessor, distance = state.predecessor, state.distance
+        queue: deque[Vertex] = deque(self._get_vertices())
+
+        while queue:
+            current_vertex = self.__min_vertex(queue, state)
+
+            if current_vertex is None:
+                break
+
+            if goals:
+                goals.discard(current_vertex._get_position())
+
+                if not goals:
+                    break
+
+            for edge in current_vertex.get_edges():
+                source = edge.get_source()
+                destination = edge.get_destination()
+                state.touch(source._get_position())
+                state.touch(destination._get_position())
+                candidate = distance[source._get_position()] + edge.get_weight()
+
+                if distance[destination._get_position()] >= candidate:
+                    predecessor[destination._get_position()] = source
+                    distance[destination._get_position()] = candidate
+
+    def __min_vertex(self, queue: deque[Vertex], state: StateStore) -> Vertex | None:
+        """
+        Gets the vertex whose distance is the least in the queue, or None when only
+        unreachable vertices are left.
+        """
         min_distance: int | float = float('inf')
-        min_vertex: Vertex = Vertex('None')
+        min_vertex: Vertex | None = None
 
-        for vertex in self.__queue:
-            if vertex.get_distance() < min_distance:
-                min_distance = vertex.get_distance()
+        for vertex in queue:
+            if state.get_distance(vertex) < min_distance:
+                min_distance = state.get_distance(vertex)
                 min_vertex = vertex
 
-        self.__queue.remove(min_vertex)
+        if min_vertex is not None:
+            queue.remove(min_vertex)
 
         return min_vertex
 
+    def shortest_paths_from(
+            self,
+            sources: Iterable[Vertex],
+            workers: int | None = None,
+            directory: str | None = None
+        ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the distances and predecessors from many sources at once. Row i of both
+        matrices belongs to the i-th source and column j to the vertex at position j;
+        unreached vertices have distance inf and predecessor -1.
+
+        The graph is frozen and copied into shared memory once, and the sources are spread
+        over a pool of workers processes, every core by default. The rows are written into
+        shared memory, or with a directory into the memory-mapped files distance.npy and
+        predecessor.npy there, which numpy.load(path, mmap_mode='r') opens again later.
+        """
+        rows = [(row, vertex._get_position()) for row, vertex in enumerate(sources)]
+        graph = self.freeze()
+        shape = (len(rows), graph.vertex_count())
+        workers = min(workers or os.cpu_count() or 1, max(len(rows), 1))
+        blocks: list[SharedMemory] = []
+        specs = []
+
+        for name, dtype in (('distance', 'float64'), ('predecessor', 'int64')):
+            if directory is not None:
+                location = os.path.join(directory, f'{name}.npy')
+                np.lib.format.open_memmap(location, mode='w+', dtype=dtype, shape=shape).flush()
+                specs.append(('file', location, shape, dtype))
+            elif workers > 1:
+                blocks.append(SharedMemory(create=True, size=max(1, shape[0] * shape[1] * 8)))
+                specs.append(('shared', blocks[-1].name, shape, dtype))
+
+        if workers == 1:
+            if directory is None:
+                distance = np.empty(shape, dtype=np.float64)
+                predecessor = np.empty(shape, dtype=np.int64)
+            else:
+                distance = np.load(specs[0][1], mmap_mode='r+')
+                predecessor = np.load(specs[1][1], mmap_mode='r+')
+
+            _fill(graph, distance, predecessor, rows)
+            return distance, predecessor
+
+        chunk = max(1, len(rows) // (workers * 4))
+        batches = [rows[i:i + chunk] for i in range(0, len(rows), chunk)]
+
+        try:
+            with SharedGraph(graph) as shared, ProcessPoolExecutor(
+                workers, initializer=_attach_worker, initargs=(shared.get_handle(), tuple(specs))
+            ) as pool:
+                for _ in pool.map(_fill_rows, batches):
+                    pass
+
+            if directory is not None:
+                return np.load(specs[0][1], mmap_mode='r'), np.load(specs[1][1], mmap_mode='r')
+
+            distance = np.ndarray(shape, dtype=np.float64, buffer=blocks[0].buf).copy()
+            predecessor = np.ndarray(shape, dtype=np.int64, buffer=blocks[1].buf).copy()
+
+            return distance, predecessor
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+    def shortest_path_tree(self, source: Vertex) -> ShortestPathTree:
+        """
+        Returns the Dijkstra shortest-path tree of the source as an immutable result.
+        Trees are cached per source until a vertex or an edge is added or removed.
+        """
+        tree = self.__trees.get(self.get_version(), source)
+
+        if tree is None:
+            tree = ShortestPathTree.from_state(self._get_vertices(), source, self.search(source))
+            self.__trees.put(self.get_version(), tree)
+
+        return tree
+
+    def all_pairs(
+            self,
+            method: str = 'auto',
+            workers: int | None = None
+        ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the distance and next-hop matrices between all pairs of vertices, indexed
+        by vertex position; extract_path of the floyd_warshall module walks a path out of
+        them. The method 'floyd_warshall' runs the blocked dense engine, 'dijkstra' one
+        heap search per vertex over workers processes, and 'auto' picks Floyd–Warshall for
+        graphs of at most FLOYD_LIMIT vertices whose density is at least FLOYD_DENSITY.
+        """
+        graph = self.freeze()
+        size = graph.vertex_count()
+
+        if method == 'auto':
+            dense = size <= FLOYD_LIMIT and graph.edge_count() >= FLOYD_DENSITY * size * size
+            method = 'floyd_warshall' if dense else 'dijkstra'
+
+        match method:
+            case 'floyd_warshall':
+                return floyd_warshall(dense_weights(graph))
+            case 'dijkstra':
+                distance, predecessor = self.shortest_paths_from(self._get_vertices(), workers)
+                return distance, next_hops(np.arange(size), predecessor)
+            case _:
+                raise ValueError(f'{method} is incorrect value for parameter method')
+
+    @staticmethod
+    def run_frozen(graph: CSRGraph, start: int) -> tuple[array, array]:
+        """
+        Performs Dijkstra search on a frozen graph starting from the given vertex id.
+        Returns the distance and predecessor buffers, where -1 marks a missing predecessor.
+        """
+        offsets = graph.get_offsets()
+        targets = graph.get_targets()
+        weights = graph.get_weights()
+        distance = array('d', [float('inf')]) * graph.vertex_count()
+        predecessor = array('q', [-1]) * graph.vertex_count()
+
+        distance[start] = 0
+        heap: list[tuple[float, int]] = [(0, start)]
+
+        while heap:
+            current_distance, vertex = heappop(heap)
+
+            if current_distance > distance[vertex]:
+                continue
+
+            for i in range(offsets[vertex], offsets[vertex + 1]):
+                destination = targets[i]
+                candidate = current_distance + weights[i]
+
+                if candidate < distance[destination]:
+                    distance[destination] = candidate
+                    predecessor[destination] = vertex
+                    heappush(heap, (candidate, destination))
+
+        return distance, predecessor
+
     def get_vertices(self) -> list[Vertex]:
         """Returns the list of vertices in the graph."""
         return self._get_vertices()
@@ -0,0 +1,97 @@
+"""Module that implements a dense all-pairs shortest-path engine on NumPy.
+
+Floyd–Warshall is run one block of pivots at a time over tiles of rows small enough to stay
+in cache, so each tile is read from memory once per block instead of once per pivot. Paths
+are kept as a next-hop matrix: next_hop[i, j] is the vertex after i on a shortest path to j,
+i itself when j is i, and -1 when j cannot be reached.
+"""
+
+import numpy as np
+
+from tools.api.csr import CSRGraph
+
+BLOCK = 64
+TILE_BYTES = 1 << 20
+
+def dense_weights(graph: CSRGraph) -> np.ndarray:
+    """Returns the weight matrix of the graph, keeping the lightest of parallel edges."""
+    size = graph.vertex_count()
+    offsets = np.asarray(graph.get_offsets(), dtype=np.int64)
+    sources = np.repeat(np.arange(size), np.diff(offsets))
+    targets = np.asarray(graph.get_targets(), dtype=np.int64)
+    weights = np.full((size, size), np.inf)
+
+    np.minimum.at(weights, (sources, targets), np.asarray(graph.get_weights(), dtype=np.float64))
+    np.fill_diagonal(weights, 0)
+
+    return weights
+
+def floyd_warshall(weights: np.ndarray, block: int = BLOCK) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the distance and next-hop matrices of a dense weight matrix, where inf marks a
+    missing edge. The rows of each pivot block are relaxed first, then every other tile of
+    rows against them, which only ever lowers distances to lengths of real paths.
+    """
+    size = len(weights)
+    distance = weights.astype(np.float64, copy=True)
+    columns = np.broadcast_to(np.arange(size), (size, size))
+    next_hop = np.where(np.isfinite(distance), columns, -1)
+    rows = max(1, TILE_BYTES // max(1, size * 16))
+
+    for start in range(0, size, block):
+        pivots = range(start, min(start + block, size))
+        tiles = [(start, pivots.stop)]
+        tiles += [(low, min(low + rows, start)) for low in range(0, start, rows)]
+        tiles += [(low, min(low + rows, size)) for low in range(pivots.stop, size, rows)]
+
+        for low, high in tiles:
+            tile, hops = distance[low:high], next_hop[low:high]
+
+            for pivot in pivots:
+                candidate = tile[:, pivot, None] + distance[pivot]
+                improved = candidate < tile
+                np.copyto(tile, candidate, where=improved)
+                np.copyto(hops, np.broadcast_to(hops[:, pivot, None], hops.shape), where=improved)
+
+    return distance, next_hop
+
+def next_hops(sources: np.ndarray, predecessor: np.ndarray) -> np.ndarray:
+    """
+    Converts predecessor rows, one per source, into next-hop rows by pointer jumping: each
+    vertex follows its predecessors until it reaches a child of the source.
+    """
+    rows, size = predecessor.shape
+    next_hop = np.empty((rows, size), dtype=np.int64)
+    sentinel = size
+
+    for row, source in enumerate(sources):
+        ancestor = np.where(predecessor[row] < 0, sentinel, predecessor[row])
+        ancestor = np.append(ancestor, sentinel)
+        children = ancestor == source
+        ancestor[children] = np.flatnonzero(children)
+        ancestor[source] = source
+
+        while True:
+            jumped = ancestor[ancestor]
+
+            if np.array_equal(jumped, ancestor):
+                break
+
+            ancestor = jumped
+
+        next_hop[row] = np.where(ancestor[:size] == sentinel, -1, ancestor[:size])
+
+    return next_hop
+
+def extract_path(next_hop: np.ndarray, source: int, target: int) -> list[int]:
+    """Returns the vertices of the shortest path between two vertices, or an empty list."""
+    if next_hop[source, target] < 0:
+        return []
+
+    path = [source]
+
+    while source != target:
+        source = int(next_hop[source, target])
+        path.append(source)
+
+    return path
@@ -0,0 +1,35 @@
+"""Module that provides admissible heuristics for A* search on a Graph.
+
+A heuristic receives a vertex and the target and returns a lower bound of the distance
+between them. Coordinates are looked up by vertex label, so they may be a list for a graph
+with integer ids or a dict for a labeled graph.
+"""
+
+from math import hypot
+from typing import Callable, Mapping, Sequence
+
+from tools.api.object import Vertex
+
+Heuristic = Callable[[Vertex, Vertex], float]
+Coordinates = Sequence[tuple[float, float]] | Mapping[str | int, tuple[float, float]]
+
+def euclidean(coordinates: Coordinates, scale: float = 1.0) -> Heuristic:
+    """
+    Returns the straight-line distance between two vertices times scale, which must not
+    exceed the smallest edge weight per unit of distance for the bound to stay admissible.
+    """
+    def heuristic(vertex: Vertex, target: Vertex) -> float:
+        x, y = coordinates[vertex.get_label()]
+        target_x, target_y = coordinates[target.get_label()]
+        return scale * hypot(x - target_x, y - target_y)
+
+    return heuristic
+
+def manhattan(coordinates: Coordinates, scale: float = 1.0) -> Heuristic:
+    """Returns the grid distance between two vertices times scale, for graphs without diagonals."""
+    def heuristic(vertex: Vertex, target: Vertex) -> float:
+        x, y = coordinates[vertex.get_label()]
+        target_x, target_y = coordinates[target.get_label()]
+        return scale * (abs(x - target_x) + abs(y - target_y))
+
+    return heuristic
@@ -1,18 +1,22 @@
 """Module that implements Kruskal's algorithm using existing Graph structure."""
 
+from array import array
+
 from matplotlib import pyplot as plt
 
 import networkx as nx
 from networkx import Graph as G
 
+from tools.api.csr import CSRGraph
+from tools.api.disjoint_set import DisjointSet
 from tools.api.graph import Graph
 from tools.api.object import Vertex, Edge
 
 class KruskalSearch(Graph):
     """A class to perform Kruskal search on a graph"""
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, deduplicate: bool = False, integer_ids: bool = False):
+        super().__init__(deduplicate, integer_ids)
         self.__trees: list[set[Edge]] = []
         self.__is_run: bool = False
 
@@ -77,17 +81,11 @@ class KruskalSearch(Graph):
         plt.tight_layout()
         plt.show()
 
-    def __get_tree(self, vertex: Vertex) -> set[Edge] | None:
-        """Gets a tree in which a vertex is included."""
-        for tree in self.__trees:
-            for edge in tree:
-                if vertex in [edge.get_source(), edge.get_destination()]:
-                    return tree
-
-        return None
-
-    def run(self):
-        """Performs Kruskal search on graph."""
+    def run(self) -> list[set[Edge]]:
+        """
+        Performs Kruskal search on graph and returns the established minimum spanning forest,
+        one set of edges per tree with the most recently completed tree last.
+        """
         vertices: list[Vertex] = self.get_vertices()
         all_edges: list[Edge] = []
 
@@ -96,33 +94,55 @@ class KruskalSearch(Graph):
 
         all_edges.sort(key=lambda edge: edge.get_weight())
 
+        components = DisjointSet(len(vertices))
+        forest: list[Edge] = []
+
         for edge in all_edges:
-            source = edge.get_source()
-            destination = edge.get_destination()
+            source = edge.get_source()._get_position()
+            destination = edge.get_destination()._get_position()
+
+            if components.union(source, destination):
+                forest.append(edge)
+
+                if components.set_count() == 1:
+                    break
 
-            source_tree = self.__get_tree(source)
-            destination_tree = self.__get_tree(destination)
+        trees: dict[int, set[Edge]] = {}
 
-            if source_tree is None and destination_tree is None:
-                self.__trees.append(set([edge]))
+        for edge in reversed(forest):
+            trees.setdefault(components.find(edge.get_source()._get_position()), set()).add(edge)
 
-            elif source_tree and destination_tree is None:
-                self.__trees.append(source_tree.union([edge]))
-                self.__trees.remove(source_tree)
+        self.__trees = list(reversed(trees.values()))
+        self.__is_run = True
 
-            elif source_tree is None and destination_tree:
-                self.__trees.append(destination_tree.union([edge]))
-                self.__trees.remove(destination_tree)
+        return self.__trees
 
-            elif source_tree and destination_tree:
-                if source_tree == destination_tree:
-                    continue
+    @staticmethod
+    def run_frozen(graph: CSRGraph) -> array:
+        """
+        Performs Kruskal search on a frozen graph.
+        Returns the positions of the edges forming the minimum spanning forest.
+        """
+        offsets = graph.get_offsets()
+        targets = graph.get_targets()
+        weights = graph.get_weights()
+        components = DisjointSet(graph.vertex_count())
+        tree = array('q')
 
-                self.__trees.append(source_tree.union([edge]).union(destination_tree))
-                self.__trees.remove(source_tree)
-                self.__trees.remove(destination_tree)
+        sources = array('q', [0]) * graph.edge_count()
 
-        self.__is_run = True
+        for source in range(graph.vertex_count()):
+            for i in range(offsets[source], offsets[source + 1]):
+                sources[i] = source
+
+        for edge_id in sorted(range(graph.edge_count()), key=weights.__getitem__):
+            if components.union(sources[edge_id], targets[edge_id]):
+                tree.append(edge_id)
+
+                if components.set_count() == 1:
+                    break
+
+        return tree
 
     def get_vertices(self) -> list[Vertex]:
         """Returns the list of vertices in the graph."""
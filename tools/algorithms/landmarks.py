@@ -0,0 +1,217 @@
+"""Module that implements ALT, A* search guided by landmarks and the triangle inequality.
+
+For a landmark L, d(L, t) - d(L, v) and d(v, L) - d(t, L) are both lower bounds of d(v, t),
+so tables of the distances from and to a few landmarks give DijkstraSearch an admissible
+heuristic for any target without further preprocessing.
+
+Layout of saved landmark tables, every integer little-endian:
+    header          magic b'AADLANDM', version u32, reserved u32,
+                    vertex count u64, landmark count u64, reserved u64
+    landmarks       landmark count x i64
+    forward         vertex count x landmark count x i64, d(L, v) at v * count + l
+    backward        vertex count x landmark count x i64, d(v, L) at v * count + l
+"""
+
+import struct
+from array import array
+from random import Random
+
+from tools.algorithms.dijkstra import DijkstraSearch
+from tools.api.binary_io import check_size, integers, little_endian, map_file
+from tools.api.csr import CSRGraph
+from tools.api.graph import Graph
+from tools.api.object import Vertex
+
+MAGIC = b'AADLANDM'
+VERSION = 1
+HEADER = struct.Struct('<8sIIQQQ')
+UNREACHABLE = -1
+
+class LandmarkTable:
+    """
+    A class holding the distances between every vertex and a set of landmarks, laid out
+    vertex by vertex so the bounds of one vertex are contiguous. Unreachable pairs are
+    stored as UNREACHABLE and never contribute a bound.
+
+    Tables built from a Graph remember its layout and raise ValueError on a vertex once a
+    removal has moved vertices to other positions. Tables built from a CSRGraph or loaded
+    from a file only know identifiers, so they trust the vertices they are given.
+    """
+
+    def __init__(
+            self,
+            landmarks: array | memoryview,
+            forward: array | memoryview,
+            backward: array | memoryview,
+            layout: int | None = None
+        ):
+        self.__landmarks = landmarks
+        self.__forward = forward
+        self.__backward = backward
+        self.__count = len(landmarks)
+        self.__layout = layout
+        self.__target: tuple[int, list[int], list[int]] = (-1, [], [])
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the tables."""
+        return f"LandmarkTable(vertices={self.vertex_count()}, landmarks={self.__count})"
+
+    # -------------------------------------------------------------------------------
+    # List of getter functions to the landmark tables
+    # -------------------------------------------------------------------------------
+
+    def vertex_count(self) -> int:
+        """Returns the number of vertices covered by the tables."""
+        return len(self.__forward) // self.__count if self.__count else 0
+
+    def get_landmarks(self) -> list[int]:
+        """Returns the identifiers of the landmarks in the order they were selected."""
+        return list(self.__landmarks)
+
+    # -------------------------------------------------------------------------------
+    # END
+    # -------------------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, graph: Graph | CSRGraph, count: int = 8, seed: int = 0) -> 'LandmarkTable':
+        """
+        Selects landmarks by farthest-point selection: the first is the vertex farthest from
+        a random vertex, and every next one the vertex farthest from all landmarks so far,
+        measured as the round trip d(L, v) + d(v, L) over the directions that exist. A vertex
+        no landmark reaches in either direction is infinitely far, so every component with
+        edges gets a landmark before any component gets a second one.
+        """
+        csr = graph.freeze() if isinstance(graph, Graph) else graph
+        reverse = csr.reverse()
+        size = csr.vertex_count()
+        count = min(count, size)
+        landmarks = array('q')
+        rows: list[tuple[array, array]] = []
+        nearest = array('d', [float('inf')]) * size
+        offsets, reverse_offsets = csr.get_offsets(), reverse.get_offsets()
+        linked = bytearray(
+            offsets[vertex] < offsets[vertex + 1]
+            or reverse_offsets[vertex] < reverse_offsets[vertex + 1]
+            for vertex in range(size)
+        )
+
+        candidate = -1
+
+        if size:
+            seen, _ = DijkstraSearch.run_frozen(csr, Random(seed).randrange(size))
+            seen = array('d', (-1.0 if d == float('inf') else d for d in seen))
+            candidate = cls.__farthest(seen, nearest, linked)
+
+        while candidate >= 0 and len(landmarks) < count:
+            landmarks.append(candidate)
+            forward, _ = DijkstraSearch.run_frozen(csr, candidate)
+            backward, _ = DijkstraSearch.run_frozen(reverse, candidate)
+            rows.append((forward, backward))
+
+            for vertex in range(size):
+                trips = [d for d in (forward[vertex], backward[vertex]) if d != float('inf')]
+
+                if trips:
+                    nearest[vertex] = min(nearest[vertex], sum(trips))
+
+            candidate = cls.__farthest(nearest, nearest, linked)
+
+        count = len(landmarks)
+        forward_table = array('q', [UNREACHABLE]) * (size * count)
+        backward_table = array('q', [UNREACHABLE]) * (size * count)
+
+        for landmark, (forward, backward) in enumerate(rows):
+            for vertex in range(size):
+                if forward[vertex] != float('inf'):
+                    forward_table[vertex * count + landmark] = int(forward[vertex])
+
+                if backward[vertex] != float('inf'):
+                    backward_table[vertex * count + landmark] = int(backward[vertex])
+
+        layout = graph._get_layout() if isinstance(graph, Graph) else None
+
+        return cls(landmarks, forward_table, backward_table, layout)
+
+    @staticmethod
+    def __farthest(distance: array, nearest: array, linked: bytearray) -> int:
+        """
+        Returns the vertex of greatest distance that is not a landmark yet, or -1 when every
+        vertex is one. Vertices with an edge come before isolated ones, which no landmark
+        could help with.
+        """
+        best, farthest = (-1, -1.0), -1
+
+        for vertex, value in enumerate(distance):
+            key = (linked[vertex], value)
+
+            if key > best and nearest[vertex] != 0:
+                best, farthest = key, vertex
+
+        return farthest
+
+    def lower_bound(self, vertex: Vertex, target: Vertex) -> int:
+        """
+        Returns the best landmark lower bound of the distance from the vertex to the target.
+        Its signature matches a heuristic of DijkstraSearch, so it can be passed as one.
+        """
+        if self.__layout is not None and vertex._get_layout() != self.__layout:
+            raise ValueError('The landmark table was built before a vertex was removed')
+
+        position, target_forward, target_backward = self.__target
+
+        if position != target._get_position():
+            position = target._get_position()
+            start = position * self.__count
+            target_forward = list(self.__forward[start:start + self.__count])
+            target_backward = list(self.__backward[start:start + self.__count])
+            self.__target = (position, target_forward, target_backward)
+
+        start = vertex._get_position() * self.__count
+        forward = self.__forward[start:start + self.__count]
+        backward = self.__backward[start:start + self.__count]
+        bound = 0
+
+        for landmark in range(self.__count):
+            from_vertex, from_target = forward[landmark], target_forward[landmark]
+
+            if from_vertex >= 0 and from_target >= 0 and from_target - from_vertex > bound:
+                bound = from_target - from_vertex
+
+            to_vertex, to_target = backward[landmark], target_backward[landmark]
+
+            if to_vertex >= 0 and to_target >= 0 and to_vertex - to_target > bound:
+                bound = to_vertex - to_target
+
+        return bound
+
+    def save(self, path: str):
+        """Writes the tables to the given path so the preprocessing is only paid once."""
+        with open(path, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, VERSION, 0, self.vertex_count(), self.__count, 0))
+
+            for buffer in (self.__landmarks, self.__forward, self.__backward):
+                file.write(little_endian(buffer))
+
+    @classmethod
+    def load(cls, path: str) -> 'LandmarkTable':
+        """Maps saved tables into memory without copying them."""
+        buffer = map_file(path)
+
+        if len(buffer) < HEADER.size:
+            raise ValueError(f"{path} is not a landmark table")
+
+        magic, version, _, vertex_count, count, _ = HEADER.unpack_from(buffer)
+
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a landmark table")
+
+        if version != VERSION:
+            raise ValueError(f"Unsupported landmark table version: {version}")
+
+        check_size(buffer, path, HEADER.size, count * (1 + 2 * vertex_count))
+
+        landmarks, position = integers(buffer, HEADER.size, count)
+        forward, position = integers(buffer, position, vertex_count * count)
+        backward, position = integers(buffer, position, vertex_count * count)
+
+        return cls(landmarks, forward, backward)
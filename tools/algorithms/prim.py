@@ -1,18 +1,22 @@
 """Module implementing Prim's algorithm for finding the minimum spanning tree of a graph."""
 
+from array import array
+from heapq import heappush, heappop
+
 from matplotlib import pyplot as plt
 
 import networkx as nx
 from networkx import Graph as G
 
+from tools.api.csr import CSRGraph
 from tools.api.graph import Graph
 from tools.api.object import Vertex, Edge
 
 class PrimSearch(Graph):
     """A class to perform Prim search on a graph"""
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, deduplicate: bool = False, integer_ids: bool = False):
+        super().__init__(deduplicate, integer_ids)
         self.__trees: set[Edge] = set()
         self.__is_run: bool = False
 
@@ -77,11 +81,12 @@ class PrimSearch(Graph):
         plt.tight_layout()
         plt.show()
 
-    def run(self, start: Vertex):
-        """Performs Prim search on graph."""
+    def run(self, start: Vertex) -> set[Edge]:
+        """Performs Prim search on graph and returns the established MST."""
         vertices: list[Vertex] = self.get_vertices()
         visited: list[Vertex] = []
         edges_to_visit: list[Edge] = []
+        trees: set[Edge] = set()
 
         visited.append(start)
 
@@ -95,7 +100,7 @@ class PrimSearch(Graph):
             if min_edge.get_destination() in visited:
                 continue
 
-            self.__trees.add(min_edge)
+            trees.add(min_edge)
             source: Vertex = min_edge.get_source()
             destination: Vertex = min_edge.get_destination()
 
@@ -108,9 +113,46 @@ class PrimSearch(Graph):
             for edge in visited[-1].get_edges():
                 if edge.get_destination() not in visited:
                     edges_to_visit.append(edge)
-        
+
+        self.__trees = trees
         self.__is_run = True
 
+        return trees
+
+    @staticmethod
+    def run_frozen(graph: CSRGraph, start: int) -> array:
+        """
+        Performs Prim search on a frozen graph starting from the given vertex id.
+        Returns the positions of the edges forming the minimum spanning tree.
+        """
+        offsets = graph.get_offsets()
+        targets = graph.get_targets()
+        weights = graph.get_weights()
+        visited = bytearray(graph.vertex_count())
+        tree = array('q')
+        heap: list[tuple[int, int]] = []
+
+        visited[start] = 1
+
+        for i in range(offsets[start], offsets[start + 1]):
+            heappush(heap, (weights[i], i))
+
+        while heap:
+            _, edge_id = heappop(heap)
+            vertex = targets[edge_id]
+
+            if visited[vertex]:
+                continue
+
+            visited[vertex] = 1
+            tree.append(edge_id)
+
+            for i in range(offsets[vertex], offsets[vertex + 1]):
+                if not visited[targets[i]]:
+                    heappush(heap, (weights[i], i))
+
+        return tree
+
     def get_vertices(self) -> list[Vertex]:
         """Returns the list of vertices in the graph."""
         return self._get_vertices()
@@ -0,0 +1,50 @@
+"""This module reads and writes the raw little-endian integer arrays of the binary formats.
+
+Graph snapshots, contraction hierarchies and landmark tables all store a fixed header
+followed by arrays of signed 64-bit integers, and are read back through a read-only
+memory map so processes opening the same file share its pages.
+"""
+
+import mmap
+import sys
+from array import array
+
+ITEM_SIZE = 8
+
+def little_endian(buffer: array | memoryview) -> bytes | memoryview:
+    """Returns the raw bytes of a buffer of 64-bit integers in little-endian order."""
+    if sys.byteorder == 'little':
+        return memoryview(buffer).cast('B')
+
+    swapped = array('q', buffer)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+def integers(buffer: memoryview, start: int, count: int) -> tuple[memoryview | array, int]:
+    """Returns a view of count 64-bit integers beginning at start, and the end position."""
+    end = start + count * ITEM_SIZE
+    view = buffer[start:end]
+
+    if sys.byteorder == 'little':
+        return view.cast('q'), end
+
+    values = array('q', view.tobytes())
+    values.byteswap()
+    return values, end
+
+def map_file(path: str) -> memoryview:
+    """Maps a file into memory read-only and returns a view of its bytes."""
+    with open(path, 'rb') as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    return memoryview(mapped)
+
+def check_size(buffer: memoryview, path: str, header_size: int, item_count: int, extra: int = 0):
+    """
+    Raises ValueError when the file is shorter than its header says, the header followed
+    by item_count integers and extra bytes.
+    """
+    expected = header_size + item_count * ITEM_SIZE + extra
+
+    if len(buffer) < expected:
+        raise ValueError(f"{path} is truncated: {len(buffer)} of {expected} bytes")
@@ -0,0 +1,108 @@
+"""This module defines a CSRGraph class, a frozen compressed sparse row snapshot of a Graph."""
+
+from array import array
+from bisect import bisect_right
+from typing import Sequence
+
+class CSRGraph:
+    """
+    A read-only graph whose vertices are packed into contiguous integer identifiers.
+    The outgoing edges of vertex i occupy positions offsets[i] to offsets[i + 1] in the
+    targets and weights buffers. The buffers may be arrays or memoryviews of the same
+    signed 64-bit items, such as views over a memory-mapped snapshot.
+    """
+
+    def __init__(
+            self,
+            labels: Sequence[str],
+            offsets: array | memoryview,
+            targets: array | memoryview,
+            weights: array | memoryview
+        ):
+        self.__labels: Sequence[str] = labels
+        self.__ids: dict[str, int] | None = None
+        self.__offsets: array | memoryview = offsets
+        self.__targets: array | memoryview = targets
+        self.__weights: array | memoryview = weights
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the graph."""
+        return f"CSRGraph(vertices={self.vertex_count()}, edges={self.edge_count()})"
+
+    # -------------------------------------------------------------------------------
+    # List of getter functions to all buffers of a frozen graph
+    # -------------------------------------------------------------------------------
+
+    def vertex_count(self) -> int:
+        """Returns the number of vertices in the graph."""
+        return len(self.__offsets) - 1
+
+    def edge_count(self) -> int:
+        """Returns the number of edges in the graph."""
+        return len(self.__targets)
+
+    def get_id(self, label: str) -> int | None:
+        """
+        Returns the integer identifier of the vertex with the given label.
+        The label index is only built on the first lookup.
+        """
+        if self.__ids is None:
+            self.__ids = {name: i for i, name in enumerate(self.__labels)}
+
+        return self.__ids.get(label)
+
+    def get_label(self, vertex_id: int) -> str:
+        """Returns the label of the vertex with the given integer identifier."""
+        return self.__labels[vertex_id]
+
+    def get_labels(self) -> Sequence[str]:
+        """Returns the labels of all vertices ordered by their identifiers."""
+        return self.__labels
+
+    def get_offsets(self) -> array | memoryview:
+        """Returns the buffer holding where each vertex's edges begin."""
+        return self.__offsets
+
+    def get_targets(self) -> array | memoryview:
+        """Returns the buffer holding the destination of every edge."""
+        return self.__targets
+
+    def get_weights(self) -> array | memoryview:
+        """Returns the buffer holding the weight of every edge."""
+        return self.__weights
+
+    def get_source(self, edge_id: int) -> int:
+        """Returns the source vertex of the edge at the given position."""
+        return bisect_right(self.__offsets, edge_id) - 1
+
+    # -------------------------------------------------------------------------------
+    # END
+    # -------------------------------------------------------------------------------
+
+    def neighbors(self, vertex_id: int) -> range:
+        """Returns the positions of the outgoing edges of a vertex."""
+        return range(self.__offsets[vertex_id], self.__offsets[vertex_id + 1])
+
+    def reverse(self) -> 'CSRGraph':
+        """Returns the graph with every edge turned around, keeping the vertex identifiers."""
+        size = self.vertex_count()
+        offsets = array('q', [0]) * (size + 1)
+
+        for target in self.__targets:
+            offsets[target + 1] += 1
+
+        for i in range(size):
+            offsets[i + 1] += offsets[i]
+
+        cursor = array('q', offsets)
+        targets = array('q', [0]) * self.edge_count()
+        weights = array('q', [0]) * self.edge_count()
+
+        for source in range(size):
+            for i in range(self.__offsets[source], self.__offsets[source + 1]):
+                position = cursor[self.__targets[i]]
+                targets[position] = source
+                weights[position] = self.__weights[i]
+                cursor[self.__targets[i]] = position + 1
+
+        return CSRGraph(self.__labels, offsets, targets, weights)
@@ -0,0 +1,74 @@
+"""This module defines an array-backed disjoint-set forest over integer elements."""
+
+from array import array
+
+class DisjointSet:
+    """
+    A union-find structure over the elements 0 to size - 1, kept in two integer arrays.
+    Finds compress the path they walk so every element on it points at the root, and
+    unions hang the smaller tree under the larger, so any sequence of operations runs
+    in nearly constant amortized time per operation.
+    """
+
+    __slots__ = ('__parent', '__size', '__count')
+
+    def __init__(self, size: int = 0):
+        self.__parent: array = array('q', range(size))
+        self.__size: array = array('q', [1]) * size
+        self.__count: int = size
+
+    def __len__(self) -> int:
+        """Returns the number of elements in the forest."""
+        return len(self.__parent)
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the forest."""
+        return f"DisjointSet(elements={len(self)}, sets={self.__count})"
+
+    # -------------------------------------------------------------------------------
+    # List of getter functions to the forest
+    # -------------------------------------------------------------------------------
+
+    def set_count(self) -> int:
+        """Returns the number of disjoint sets."""
+        return self.__count
+
+    def get_size(self, element: int) -> int:
+        """Returns the number of elements in the set containing the element."""
+        return self.__size[self.find(element)]
+
+    # -------------------------------------------------------------------------------
+    # END
+    # -------------------------------------------------------------------------------
+
+    def find(self, element: int) -> int:
+        """Returns the root of the set containing the element."""
+        parent = self.__parent
+        root = element
+
+        while parent[root] != root:
+            root = parent[root]
+
+        while parent[element] != root:
+            parent[element], element = root, parent[element]
+
+        return root
+
+    def union(self, first: int, second: int) -> bool:
+        """
+        Merges the sets containing both elements.
+        Returns False when they were already in the same set.
+        """
+        first, second = self.find(first), self.find(second)
+
+        if first == second:
+            return False
+
+        if self.__size[first] < self.__size[second]:
+            first, second = second, first
+
+        self.__parent[second] = first
+        self.__size[first] += self.__size[second]
+        self.__count -= 1
+
+        return True
@@ -0,0 +1,189 @@
+"""This module generates seeded synthetic graphs for exercising the algorithms at scale.
+
+Every generator draws from its own random.Random(seed), so the same arguments always
+produce the same graph. The edges are yielded in a fixed order and are either fed to a
+Graph with integer ids or packed straight into a CSRGraph without building any Vertex or
+Edge objects.
+"""
+
+import random
+from array import array
+from typing import Iterator
+
+from tools.api.csr import CSRGraph
+from tools.api.graph import Graph
+
+def erdos_renyi(
+        vertices: int,
+        edges: int,
+        seed: int = 0,
+        max_weight: int = 1
+    ) -> Iterator[tuple[int, int, int]]:
+    """
+    Yields a directed G(n, m) random graph: the given number of distinct edges chosen
+    uniformly among all ordered pairs of distinct vertices.
+    """
+    if edges > vertices * (vertices - 1):
+        raise ValueError("Too many edges for the number of vertices")
+
+    rng = random.Random(seed)
+    seen: set[tuple[int, int]] = set()
+
+    while len(seen) < edges:
+        source = rng.randrange(vertices)
+        destination = rng.randrange(vertices)
+
+        if source == destination or (source, destination) in seen:
+            continue
+
+        seen.add((source, destination))
+        yield (source, destination, rng.randint(1, max_weight))
+
+def grid(
+        rows: int,
+        columns: int,
+        seed: int = 0,
+        max_weight: int = 1
+    ) -> Iterator[tuple[int, int, int]]:
+    """
+    Yields a road-like grid where every cell is linked to its right and lower neighbour
+    in both directions. Vertex (row, column) has the id row * columns + column.
+    """
+    rng = random.Random(seed)
+
+    for row in range(rows):
+        for column in range(columns):
+            vertex = row * columns + column
+
+            if column + 1 < columns:
+                weight = rng.randint(1, max_weight)
+                yield (vertex, vertex + 1, weight)
+                yield (vertex + 1, vertex, weight)
+
+            if row + 1 < rows:
+                weight = rng.randint(1, max_weight)
+                yield (vertex, vertex + columns, weight)
+                yield (vertex + columns, vertex, weight)
+
+def grid_coordinates(rows: int, columns: int) -> list[tuple[float, float]]:
+    """Returns the (x, y) position of every vertex of a grid, ordered by vertex id."""
+    return [(float(column), float(row)) for row in range(rows) for column in range(columns)]
+
+def barabasi_albert(
+        vertices: int,
+        attachments: int,
+        seed: int = 0,
+        max_weight: int = 1
+    ) -> Iterator[tuple[int, int, int]]:
+    """
+    Yields a scale-free graph grown by preferential attachment: each new vertex links to
+    the given number of distinct existing vertices, chosen with probability proportional
+    to their degree. Every link is yielded in both directions.
+    """
+    if not 0 < attachments < vertices:
+        raise ValueError("Attachments must be between zero and the number of vertices")
+
+    rng = random.Random(seed)
+    endpoints = array('q', range(attachments))
+
+    for vertex in range(attachments, vertices):
+        chosen: dict[int, None] = {}
+
+        while len(chosen) < attachments:
+            chosen[endpoints[rng.randrange(len(endpoints))]] = None
+
+        for target in chosen:
+            weight = rng.randint(1, max_weight)
+            yield (vertex, target, weight)
+            yield (target, vertex, weight)
+            endpoints.append(target)
+            endpoints.append(vertex)
+
+def complete(vertices: int, seed: int = 0, max_weight: int = 1) -> Iterator[tuple[int, int, int]]:
+    """Yields a complete directed graph with an edge between every ordered pair of vertices."""
+    rng = random.Random(seed)
+
+    for source in range(vertices):
+        for destination in range(vertices):
+            if source != destination:
+                yield (source, destination, rng.randint(1, max_weight))
+
+def random_dag(
+        vertices: int,
+        edges: int,
+        seed: int = 0,
+        max_weight: int = 1
+    ) -> Iterator[tuple[int, int, int]]:
+    """
+    Yields a random weighted directed acyclic graph. Vertices are shuffled into a hidden
+    topological order and every edge goes from an earlier to a later vertex of it.
+    """
+    if edges > vertices * (vertices - 1) // 2:
+        raise ValueError("Too many edges for the number of vertices")
+
+    rng = random.Random(seed)
+    order = list(range(vertices))
+    rng.shuffle(order)
+    seen: set[tuple[int, int]] = set()
+
+    while len(seen) < edges:
+        first = rng.randrange(vertices)
+        second = rng.randrange(vertices)
+
+        if first == second:
+            continue
+
+        pair = (min(first, second), max(first, second))
+
+        if pair in seen:
+            continue
+
+        seen.add(pair)
+        yield (order[pair[0]], order[pair[1]], rng.randint(1, max_weight))
+
+def to_graph(
+        vertices: int,
+        edges: Iterator[tuple[int, int, int]],
+        graph: Graph | None = None
+    ) -> Graph:
+    """Loads generated edges into a graph with integer ids, creating every vertex first."""
+    if graph is None:
+        graph = Graph(integer_ids=True)
+
+    if not graph.is_integer_ids():
+        raise ValueError("Generated graphs need a graph with integer ids")
+
+    if vertices > 0:
+        graph.add_vertex(vertices - 1)
+
+    graph.add_edges_from(edges)
+
+    return graph
+
+def to_csr(vertices: int, edges: Iterator[tuple[int, int, int]]) -> CSRGraph:
+    """Packs generated edges straight into a CSRGraph, keeping each vertex's edges in order."""
+    sources = array('q')
+    targets = array('q')
+    weights = array('q')
+    degree = array('q', [0]) * (vertices + 1)
+
+    for source, destination, weight in edges:
+        sources.append(source)
+        targets.append(destination)
+        weights.append(weight)
+        degree[source + 1] += 1
+
+    for i in range(vertices):
+        degree[i + 1] += degree[i]
+
+    cursor = array('q', degree)
+    packed_targets = array('q', [0]) * len(targets)
+    packed_weights = array('q', [0]) * len(targets)
+
+    for i, source in enumerate(sources):
+        position = cursor[source]
+        packed_targets[position] = targets[i]
+        packed_weights[position] = weights[i]
+        cursor[source] = position + 1
+
+    return CSRGraph([str(i) for i in range(vertices)], degree, packed_targets, packed_weights)
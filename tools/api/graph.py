@@ -1,103 +1,456 @@
 """This module defines a Graph class that represents a graph using vertices and edges."""
 
+import sys
+from array import array
+from typing import Iterable, Iterator
+
+from tools.api.csr import CSRGraph
 from tools.api.object import Vertex, Edge
+from tools.api.state import StateStore, StoreHandle
 from helper.validators import validate_labels
 
 class Graph:
-    """A class representing a graph, which consists of vertices and edges."""
-
-    def __init__(self):
+    """
+    A class representing a graph, which consists of vertices and edges.
+    With deduplicate enabled, inserting an edge whose source already has an edge to the
+    same destination is skipped instead of adding a parallel edge.
+
+    With integer_ids enabled, vertices are labeled by the dense integers 0 to V - 1, which
+    are also their positions, so no label index is kept. Such vertices may carry an
+    optional name from an interned name table.
+    """
+
+    def __init__(self, deduplicate: bool = False, integer_ids: bool = False):
+        self.__deduplicate: bool = deduplicate
+        self.__integer_ids: bool = integer_ids
         self.__vertices: list[Vertex] = []
-
-    def definition(self, algorithm: str) -> str:
-        """Returns the definition of the graph."""
-        vertices = '\n\tGraph Definition:\n'
-
+        self.__positions: dict[str, int] = {}
+        self.__names: dict[int, str] = {}
+        self.__named: dict[str, int] = {}
+        self.__handle: StoreHandle = StoreHandle(StateStore())
+        self.__version: int = 0
+        self.__max_weight: int = 0
+        self.__reverse: list[list[Edge]] = []
+        self.__reverse_version: int = 0
+
+    def definition(self, algorithm: str, offset: int = 0, limit: int | None = None) -> str:
+        """Returns the definition of the graph, optionally limited to a window of vertices."""
+        lines = '\n'.join(self.iter_definition(algorithm, offset, limit))
+        return f'\n\tGraph Definition:\n{lines}\n'
+
+    def iter_definition(
+            self,
+            algorithm: str,
+            offset: int = 0,
+            limit: int | None = None
+        ) -> Iterator[str]:
+        """Yields the definition of the graph one vertex line at a time."""
         if not self.__vertices:
-            vertices += '\t  Graph is empty'
+            yield '\t  Graph is empty'
+            return
 
-        for vertex in self.__vertices:
-            vertices += "\t  - "
+        stop = len(self.__vertices) if limit is None else min(offset + limit, len(self.__vertices))
 
-            match algorithm:
-                case 'bfs':
-                    vertices += vertex.definition('bfs')
-                case 'dfs':
-                    vertices += vertex.definition('dfs')
-                case 'kruskal':
-                    vertices += vertex.definition('kruskal')
-                case 'prim':
-                    vertices += vertex.definition('prim')
-                case 'dijkstra':
-                    vertices += vertex.definition('dijkstra')
-
-            if vertex.get_label() != self.__vertices[-1].get_label():
-                vertices += '\n'
-
-        return vertices + '\n'
+        for position in range(max(offset, 0), stop):
+            yield '\t  - ' + self.__vertices[position].definition(algorithm)
 
     def _get_vertices(self) -> list[Vertex]:
         """Returns the list of vertices in the graph."""
         return self.__vertices
 
+    def get_version(self) -> int:
+        """Returns a counter that changes whenever a vertex or an edge is added or removed."""
+        return self.__version
+
+    def _get_layout(self) -> int:
+        """Returns a counter that changes whenever a removal moves a vertex to another position."""
+        return self.__handle.layout
+
+    def _get_max_weight(self) -> int:
+        """
+        Returns an upper bound of the edge weights, kept up to date as edges are added or
+        made heavier. Lowering a weight or removing a vertex leaves it a valid bound.
+        """
+        return self.__max_weight
+
+    def is_integer_ids(self) -> bool:
+        """Checks if the vertices of the graph are labeled by dense integers."""
+        return self.__integer_ids
+
     @validate_labels('label')
-    def get_vertex(self, label: str) -> 'Vertex | None':
+    def get_vertex(self, label: str | int) -> 'Vertex | None':
         """Retrieves a vertex by its label."""
-        for vertex in self.__vertices:
-            if vertex.get_label() == label:
-                return vertex
+        if self.__integer_ids:
+            if isinstance(label, int) and label < len(self.__vertices):
+                return self.__vertices[label]
+
+            return None
 
-        return None
+        position = self.__positions.get(label)  # type: ignore[arg-type]
+
+        if position is None:
+            return None
+
+        return self.__vertices[position]
 
     @validate_labels('label')
-    def add_vertex(self, label: str) -> bool:
-        """Adds a vertex with the given label to the graph."""
-        if self.get_vertex(label) is None:
-            vertex = Vertex(label)
-            self.__vertices.append(vertex)
-            return True
+    def add_vertex(self, label: str | int) -> bool | str:
+        """
+        Adds a vertex with the given label to the graph.
+        In integer mode every missing identifier up to the label is added as well.
+        """
+        error = self.__label_error(label)
+
+        if error:
+            return error
+
+        if self.__has_label(label):
+            return False
 
-        return False
+        self.__append_vertices([label])
 
-    def add_edge(self, source: Vertex, destination: Vertex, weight: int | tuple[int, int] = 1):
-        """Adds an edge between two vertices in the graph."""
+        return True
+
+    def __label_error(self, label) -> str:
+        """Returns the error message of a label of the wrong kind, or an empty string."""
+        if self.__integer_ids and not isinstance(label, int):
+            return "Invalid: Only accepts non-negative integers"
+
+        if not self.__integer_ids and not isinstance(label, str):
+            return "Invalid: Only accepts alphabetics without spaces in between"
+
+        return ''
+
+    def __has_label(self, label) -> bool:
+        """Checks if a vertex with the given label is in the graph."""
+        if self.__integer_ids:
+            return label < len(self.__vertices)
+
+        return label in self.__positions
+
+    def __append_vertices(self, labels: Iterable):
+        """
+        Appends vertices whose labels are known to be valid and not yet in the graph.
+        In integer mode the graph grows until it holds the largest label.
+        """
+        fresh = self.__reverse_version == self.__version
+        self.__version += 1
+
+        if self.__integer_ids:
+            for position in range(len(self.__vertices), max(labels, default=-1) + 1):
+                self.__handle.store.append()
+                self.__vertices.append(Vertex._create(position, self.__handle, position))
+        else:
+            for label in labels:
+                position = len(self.__vertices)
+                self.__positions[label] = position
+                self.__handle.store.append()
+                self.__vertices.append(Vertex._create(label, self.__handle, position))
+
+        if fresh:
+            self.__reverse.extend([] for _ in range(len(self.__vertices) - len(self.__reverse)))
+            self.__reverse_version = self.__version
+
+    def add_vertices_from(self, labels: Iterable[str | int]) -> int:
+        """
+        Adds a vertex for every label that is not in the graph yet.
+        Returns the number of vertices added, or raises ValueError on an invalid label
+        before any vertex is added.
+        """
+        new_labels: dict[str | int, None] = {}
+
+        for label in labels:
+            if label not in new_labels:
+                self.__check_label(label)
+
+                if not self.__has_label(label):
+                    new_labels[label] = None
+
+        size = len(self.__vertices)
+
+        self.__append_vertices(new_labels)
+
+        return len(self.__vertices) - size
+
+    # -------------------------------------------------------------------------------
+    # List of functions to the interned name table of an integer-labeled graph
+    # -------------------------------------------------------------------------------
+
+    def set_name(self, vertex_id: int, name: str):
+        """Gives a name to the vertex with the given identifier."""
+        if not self.__integer_ids:
+            raise ValueError("Names are only available for integer-labeled graphs")
+
+        if not 0 <= vertex_id < len(self.__vertices):
+            raise ValueError(f"Vertex {vertex_id} is not in the graph")
+
+        previous = self.__names.get(vertex_id)
+
+        if previous is not None:
+            del self.__named[previous]
+
+        name = sys.intern(name)
+        self.__names[vertex_id] = name
+        self.__named[name] = vertex_id
+
+    def get_name(self, vertex_id: int) -> str:
+        """Returns the name of the vertex with the given identifier, or the identifier itself."""
+        return self.__names.get(vertex_id, str(vertex_id))
+
+    def get_vertex_by_name(self, name: str) -> 'Vertex | None':
+        """Retrieves a vertex of an integer-labeled graph by its name."""
+        vertex_id = self.__named.get(name)
+        return None if vertex_id is None else self.__vertices[vertex_id]
+
+    # -------------------------------------------------------------------------------
+    # END
+    # -------------------------------------------------------------------------------
+
+    def add_edges_from(self, edges: Iterable[tuple]) -> int:
+        """
+        Adds every edge given as (source, destination, weight) for a one-direction edge or
+        (source, destination, weight, back_weight) for a two-direction edge, where source and
+        destination are labels. Missing vertices are created in the order they appear.
+        Returns the number of edges added, which excludes duplicates skipped under the
+        deduplicate policy, or raises ValueError on an invalid entry before the graph is
+        modified.
+        """
+        adjacency: dict[str | int, list[tuple[str | int, int]]] = {}
+        new_labels: dict[str | int, None] = {}
+        max_weight = self.__max_weight
+
+        for entry in edges:
+            match entry:
+                case (source, destination, weight):
+                    self.__check_weight(weight, entry)
+                    adjacency.setdefault(source, []).append((destination, weight))
+                    max_weight = max(max_weight, weight)
+                case (source, destination, weight, back_weight):
+                    self.__check_weight(weight, entry)
+                    self.__check_weight(back_weight, entry)
+                    max_weight = max(max_weight, weight, back_weight)
+                    adjacency.setdefault(source, []).append((destination, weight))
+                    adjacency.setdefault(destination, []).append((source, back_weight))
+                case _:
+                    raise ValueError(f"Invalid edge: {entry!r}")
+
+            for label in (source, destination):
+                if label not in new_labels:
+                    self.__check_label(label)
+
+                    if not self.__has_label(label):
+                        new_labels[label] = None
+
+        self.__append_vertices(new_labels)
+
+        vertices = self.__vertices
+        position = int if self.__integer_ids else self.__positions.__getitem__
+        count = 0
+
+        for source_label, targets in adjacency.items():
+            source = vertices[position(source_label)]
+            edges = [Edge(source, vertices[position(label)], weight) for label, weight in targets]
+
+            if self.__deduplicate:
+                unique: dict[Vertex, Edge] = {}
+
+                for edge in edges:
+                    if not source.has_edge_to(edge.get_destination()):
+                        unique.setdefault(edge.get_destination(), edge)
+
+                edges = list(unique.values())
+
+            source.add_edges(edges)
+            count += len(edges)
+
+        self.__version += 1
+        self.__max_weight = max_weight
+
+        return count
+
+    def __check_label(self, label):
+        """Raises ValueError when a label would be rejected by add_vertex."""
+        if self.__integer_ids:
+            if not isinstance(label, int) or isinstance(label, bool) or label < 0:
+                raise ValueError(f"Invalid label: {label!r}")
+
+        elif not isinstance(label, str) or not label.isalpha():
+            raise ValueError(f"Invalid label: {label!r}")
+
+    @staticmethod
+    def __check_weight(weight, entry: tuple):
+        """Raises ValueError when a weight would be rejected by add_edge."""
+        if not isinstance(weight, int) or weight < 1:
+            raise ValueError(f"Invalid weight in edge: {entry!r}")
+
+    @validate_labels('label')
+    def remove_vertex(self, label: str) -> bool:
+        """
+        Removes the vertex with the given label along with every edge pointing to it.
+        The last vertex takes over the position of the removed one, so the vertex list
+        never shifts. Integer-labeled graphs must stay dense and cannot remove vertices.
+
+        Moving a vertex starts a new layout: the store shown through the vertices moves
+        its slots along, while every other store and landmark table filled for the old
+        layout refuses further lookups.
+        """
+        if self.__integer_ids:
+            raise ValueError("Vertices cannot be removed from an integer-labeled graph")
+
+        position = self.__positions.pop(label, None)
+
+        if position is None:
+            return False
+
+        self.__version += 1
+        vertex = self.__vertices[position]
+        last = self.__vertices.pop()
+        self.__handle.store.swap_remove(position)
+
+        if last is not vertex:
+            self.__vertices[position] = last
+            last._relocate(position)
+            self.__positions[str(last.get_label())] = position
+            self.__handle.layout += 1
+            self.__handle.store.layout = self.__handle.layout
+
+        for other in self.__vertices:
+            other.remove_edges_to(vertex)
+
+        return True
+
+    def add_edge(
+            self,
+            source: Vertex,
+            destination: Vertex,
+            weight: int | tuple[int, int] = 1
+        ) -> int:
+        """
+        Adds an edge between two vertices in the graph and returns how many were added.
+        The weight is a positive integer, or a pair of them for an edge in both directions;
+        any other weight adds nothing, as in add_edges_from.
+        """
         from_src: Edge | None = None
+        added: list[Edge] = []
 
         if isinstance(weight, int) and weight > 0:
             from_src = Edge(source, destination, weight)
 
-        if isinstance(weight, tuple) and len(weight) == 2 and weight[0] > 0 and weight[1] > 0:
+        pair = isinstance(weight, tuple) and len(weight) == 2
+
+        if pair and all(isinstance(part, int) and part > 0 for part in weight):
             from_src = Edge(source, destination, weight[0])
-            from_dest = Edge(destination, source, weight[-1])
-            destination.add_edge(from_dest)
 
-        if isinstance(from_src, Edge):
-            source.add_edge(from_src)
+            if not (self.__deduplicate and destination.has_edge_to(source)):
+                added.append(Edge(destination, source, weight[-1]))
+
+        duplicate = self.__deduplicate and source.has_edge_to(destination)
+
+        if isinstance(from_src, Edge) and not duplicate:
+            added.append(from_src)
+
+        self._insert_edges(added)
+
+        return len(added)
+
+    def _insert_edges(self, edges: list[Edge]):
+        """
+        Appends edges between vertices of the graph to their sources. A reverse adjacency
+        that was current stays current by gaining the new edges as well.
+        """
+        fresh = self.__reverse_version == self.__version
+        self.__version += 1
+
+        for edge in edges:
+            edge.get_source().add_edge(edge)
+            self.__max_weight = max(self.__max_weight, edge.get_weight())
+
+            if fresh:
+                self.__reverse[edge.get_destination()._get_position()].append(edge)
+
+        if fresh:
+            self.__reverse_version = self.__version
+
+    def set_weight(self, source: Vertex, destination: Vertex, weight: int) -> bool:
+        """Changes the weight of the first edge from the source to the destination."""
+        edge = source.get_edge_to(destination)
+
+        if edge is None or not isinstance(weight, int) or weight < 1:
+            return False
+
+        fresh = self.__reverse_version == self.__version
+        self.__version += 1
+        edge._set_weight(weight)
+        self.__max_weight = max(self.__max_weight, weight)
+
+        if fresh:
+            self.__reverse_version = self.__version
+
+        return True
+
+    def has_edge(self, source: Vertex, destination: Vertex) -> bool:
+        """Checks if there's an edge from the source to the destination."""
+        return source.has_edge_to(destination)
+
+    def get_edge(self, source: Vertex, destination: Vertex) -> Edge | None:
+        """Retrieves the first edge from the source to the destination."""
+        return source.get_edge_to(destination)
+
+    def _get_reverse_edges(self) -> list[list[Edge]]:
+        """
+        Returns the incoming edges of every vertex, ordered by vertex position.
+        The reverse adjacency is built once and only rebuilt after the graph has changed.
+        """
+        if self.__reverse_version != self.__version or len(self.__reverse) != len(self.__vertices):
+            reverse: list[list[Edge]] = [[] for _ in self.__vertices]
+
+            for vertex in self.__vertices:
+                for edge in vertex.get_edges():
+                    reverse[edge.get_destination()._get_position()].append(edge)
+
+            self.__reverse = reverse
+            self.__reverse_version = self.__version
+
+        return self.__reverse
+
+    def freeze(self) -> CSRGraph:
+        """Packs the graph into a read-only compressed sparse row snapshot."""
+        ids: dict[Vertex, int] = {vertex: i for i, vertex in enumerate(self.__vertices)}
+        offsets = array('q', [0])
+        targets = array('q')
+        weights = array('q')
 
-    def _reset(self, algorithm: str):
-        """Resets the graph's vertices to their initial state."""
         for vertex in self.__vertices:
-            match algorithm:
-                case 'bfs':
-                    vertex.update_bfs_attributes(
-                        color="gray",
-                        predecessor=None,
-                        distance=float('inf')
-                    )
-                case 'dfs':
-                    vertex.update_dfs_attributes(
-                        color="gray",
-                        predecessor=None,
-                        discovery_time=0,
-                        finish_time=0
-                    )
-                case 'dijkstra':
-                    vertex.update_dijkstra_attributes(
-                        predecessor=None,
-                        distance=float('inf')
-                    )
-                case _:
-                    raise ValueError(f'{algorithm} is incorrect value for parameter include')
+            for edge in vertex.get_edges():
+                targets.append(ids[edge.get_destination()])
+                weights.append(edge.get_weight())
+
+            offsets.append(len(targets))
+
+        if self.__integer_ids:
+            labels = [self.get_name(position) for position in range(len(self.__vertices))]
+        else:
+            labels = [str(vertex.get_label()) for vertex in self.__vertices]
+
+        return CSRGraph(labels, offsets, targets, weights)
+
+    def _begin_store(self, workspace: StateStore | None = None) -> StateStore:
+        """
+        Starts a run in the given workspace, or in a fresh store, with an initial slot for
+        every vertex of the graph in its current layout.
+        """
+        state = workspace if workspace is not None else StateStore(len(self.__vertices))
+        state.begin(len(self.__vertices))
+        state.layout = self.__handle.layout
+        return state
+
+    def _get_store(self) -> StateStore:
+        """Returns the store whose state is shown through the graph's vertices."""
+        return self.__handle.store
+
+    def _set_store(self, store: StateStore):
+        """Shows the state of the given store through the graph's vertices in O(1)."""
+        self.__handle.store = store
 
     def create_graph_from_problem_statement(self, task_number: int):
         """Creates a graph from a problem statement."""
@@ -114,8 +467,7 @@ class Graph:
 
     def __create_graph_task_1(self):
         """Creates a graph for task 1."""
-        for i in range(65, 75):
-            self.add_vertex(chr(i))
+        self.add_vertices_from(chr(i) for i in range(65, 75))
 
         edge_dictionary = {
             'A': ['B', 'D', 'E'],
@@ -130,19 +482,15 @@ class Graph:
             'J': [],
         }
 
-        for source_label, destination_labels in edge_dictionary.items():
-            source = self.get_vertex(source_label)
-
-            for label in destination_labels:
-                destination = self.get_vertex(label)
-
-                if source and destination:
-                    self.add_edge(source, destination)
+        self.add_edges_from(
+            (source_label, label, 1)
+            for source_label, destination_labels in edge_dictionary.items()
+            for label in destination_labels
+        )
 
     def __create_graph_task_2(self):
         """Creates a graph for task 2 with weighted edges."""
-        for i in range(65, 76):
-            self.add_vertex(chr(i))
+        self.add_vertices_from(chr(i) for i in range(65, 76))
 
         edge_dictionary = {
             'A': [('C', 4), ('B', 14)],
@@ -157,19 +505,15 @@ class Graph:
             'J': [('K', 3)]
         }
 
-        for source_label, destination_labels in edge_dictionary.items():
-            source = self.get_vertex(source_label)
-
-            for label, weight in destination_labels:
-                destination = self.get_vertex(label)
-
-                if source and destination:
-                    self.add_edge(source, destination, (weight, weight))
+        self.add_edges_from(
+            (source_label, label, weight, weight)
+            for source_label, destination_labels in edge_dictionary.items()
+            for label, weight in destination_labels
+        )
 
     def __create_graph_task_3(self):
         """Creates a graph for task 3 with weighted edges for Dijkstra."""
-        for label in ['S', 'U', 'X', 'V', 'Y']:
-            self.add_vertex(label)
+        self.add_vertices_from(['S', 'U', 'X', 'V', 'Y'])
 
         edge_dictionary = {
             'S': [('U', 10), ('X', 5)],
@@ -179,11 +523,8 @@ class Graph:
             'Y': [('S', 7), ('V', 6)]
         }
 
-        for source_label, destination_labels in edge_dictionary.items():
-            source = self.get_vertex(source_label)
-
-            for label, weight in destination_labels:
-                destination = self.get_vertex(label)
-
-                if source and destination:
-                    self.add_edge(source, destination, weight)
+        self.add_edges_from(
+            (source_label, label, weight)
+            for source_label, destination_labels in edge_dictionary.items()
+            for label, weight in destination_labels
+        )
@@ -0,0 +1,301 @@
+"""This module streams graphs stored as SNAP, DIMACS or CSV edge lists into a Graph.
+
+When the graph uses integer ids, the ids of a file are mapped to the dense identifiers
+that follow the vertices already in the graph, in order of first appearance, and each
+vertex keeps its original id as its name; an id naming a vertex already in the graph
+maps to that vertex. Otherwise numeric ids are turned into alphabetic labels with
+alphabetic_label.
+"""
+
+import csv
+import gzip
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, TextIO
+
+from tools.api.graph import Graph
+
+CHUNK_SIZE = 100_000
+
+@dataclass
+class LoadReport:
+    """A class to provide the progress of loading a graph file."""
+    lines: int = 0
+    edges: int = 0
+    seconds: float = 0.0
+
+    @property
+    def edges_per_second(self) -> float:
+        """Returns the loading throughput."""
+        return self.edges / self.seconds if self.seconds > 0 else 0.0
+
+def alphabetic_label(vertex_id: int) -> str:
+    """
+    Converts a non-negative integer identifier into an alphabetic label in the same way
+    spreadsheet columns are named: 0 is 'A', 25 is 'Z', 26 is 'AA' and so on.
+    """
+    label = ''
+    vertex_id += 1
+
+    while vertex_id > 0:
+        vertex_id, remainder = divmod(vertex_id - 1, 26)
+        label = chr(65 + remainder) + label
+
+    return label
+
+def _malformed(path: str, line_number: int, problem: str) -> ValueError:
+    """Returns the error of a malformed line, located by the path and the line number."""
+    return ValueError(f"{path}:{line_number}: {problem}")
+
+def _integer(field: str, path: str, line_number: int) -> int:
+    """Parses an integer field, raising a located ValueError when it is not one."""
+    try:
+        return int(field)
+    except ValueError:
+        raise _malformed(path, line_number, f"{field!r} is not an integer") from None
+
+def _open_text(path: str) -> TextIO:
+    """Opens a plain or gzip-compressed text file for buffered line reading."""
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8')
+
+    return open(path, 'r', encoding='utf-8', buffering=1 << 20)
+
+class _VertexIds:
+    """
+    A class turning the id fields of a file into labels of the graph. In integer mode the
+    names of new vertices are kept pending until their chunk has been added to the graph.
+    """
+
+    def __init__(self, graph: Graph):
+        self.__graph: Graph = graph
+        self.__integer_ids: bool = graph.is_integer_ids()
+        self.__ids: dict[str, int] = {}
+        self.__pending: list[tuple[int, str]] = []
+        self.__next: int = len(graph._get_vertices())
+
+    def __call__(self, field: str) -> str | int:
+        """Returns the label of the vertex with the given id."""
+        if not self.__integer_ids:
+            return alphabetic_label(int(field))
+
+        vertex_id = self.__ids.get(field)
+
+        if vertex_id is None:
+            vertex = self.__graph.get_vertex_by_name(field)
+
+            if vertex is not None:
+                vertex_id = int(vertex.get_label())  # type: ignore[arg-type]
+            else:
+                vertex_id = self.__next
+                self.__next += 1
+                self.__pending.append((vertex_id, field))
+
+            self.__ids[field] = vertex_id
+
+        return vertex_id
+
+    def is_integer_ids(self) -> bool:
+        """Checks if the ids are mapped to dense integers."""
+        return self.__integer_ids
+
+    def flush(self):
+        """Names the vertices created since the last flush after their original ids."""
+        for vertex_id, name in self.__pending:
+            self.__graph.set_name(vertex_id, name)
+
+        self.__pending = []
+
+def _ingest(
+        graph: Graph,
+        entries: Iterable[tuple],
+        report: LoadReport,
+        chunk_size: int,
+        on_chunk: Callable[[LoadReport], None] | None,
+        ids: _VertexIds
+    ) -> LoadReport:
+    """Feeds the parsed entries to the graph in chunks and keeps the report up to date."""
+    started = time.perf_counter()
+    chunk: list[tuple] = []
+
+    for entry in entries:
+        chunk.append(entry)
+
+        if len(chunk) >= chunk_size:
+            report.edges += graph.add_edges_from(chunk)
+            ids.flush()
+            report.seconds = time.perf_counter() - started
+            chunk = []
+
+            if on_chunk is not None:
+                on_chunk(report)
+
+    if chunk:
+        report.edges += graph.add_edges_from(chunk)
+        ids.flush()
+
+    report.seconds = time.perf_counter() - started
+
+    if on_chunk is not None:
+        on_chunk(report)
+
+    return report
+
+def load_snap(
+        graph: Graph,
+        path: str,
+        directed: bool = True,
+        chunk_size: int = CHUNK_SIZE,
+        on_chunk: Callable[[LoadReport], None] | None = None
+    ) -> LoadReport:
+    """
+    Streams a SNAP edge list, one 'source destination [weight]' pair per line with '#'
+    comments, into the graph. A malformed line raises ValueError with its location.
+    """
+    report = LoadReport()
+    label = _VertexIds(graph)
+
+    def entries() -> Iterator[tuple]:
+        with _open_text(path) as file:
+            for line in file:
+                report.lines += 1
+                fields = line.split()
+
+                if not fields or fields[0].startswith('#'):
+                    continue
+
+                if len(fields) < 2:
+                    raise _malformed(path, report.lines, "expected 'source destination [weight]'")
+
+                if not label.is_integer_ids():
+                    _integer(fields[0], path, report.lines)
+                    _integer(fields[1], path, report.lines)
+
+                weight = _integer(fields[2], path, report.lines) if len(fields) > 2 else 1
+
+                if directed:
+                    yield (label(fields[0]), label(fields[1]), weight)
+                else:
+                    yield (label(fields[0]), label(fields[1]), weight, weight)
+
+    return _ingest(graph, entries(), report, chunk_size, on_chunk, label)
+
+def load_dimacs(
+        graph: Graph,
+        path: str,
+        chunk_size: int = CHUNK_SIZE,
+        on_chunk: Callable[[LoadReport], None] | None = None
+    ) -> LoadReport:
+    """
+    Streams a DIMACS shortest-path file (.gr) into the graph. The 'p sp vertices arcs'
+    line adds every declared vertex, isolated ones included, and 'a source destination
+    weight' lines add the arcs. DIMACS ids start at 1, so id 1 is the first new vertex.
+    A malformed 'p' or 'a' line raises ValueError with its location.
+    """
+    report = LoadReport()
+    ids = _VertexIds(graph)
+
+    def label(field: str) -> str | int:
+        if ids.is_integer_ids():
+            return ids(field)
+
+        return alphabetic_label(_integer(field, path, report.lines) - 1)
+
+    def entries() -> Iterator[tuple]:
+        with _open_text(path) as file:
+            for line in file:
+                report.lines += 1
+
+                if line.startswith('p'):
+                    fields = line.split()
+
+                    if len(fields) != 4:
+                        raise _malformed(path, report.lines, "expected 'p sp vertices arcs'")
+
+                    vertex_count = _integer(fields[2], path, report.lines)
+                    graph.add_vertices_from(label(str(i)) for i in range(1, vertex_count + 1))
+                    ids.flush()
+
+                if not line.startswith('a'):
+                    continue
+
+                fields = line.split()
+
+                if len(fields) != 4:
+                    raise _malformed(
+                        path, report.lines, "expected 'a source destination weight'"
+                    )
+
+                _, source, destination, weight = fields
+                yield (label(source), label(destination), _integer(weight, path, report.lines))
+
+    return _ingest(graph, entries(), report, chunk_size, on_chunk, ids)
+
+def load_csv(
+        graph: Graph,
+        path: str,
+        delimiter: str = ',',
+        header: bool = False,
+        columns: tuple[int, int, int | None] = (0, 1, 2),
+        directed: bool = True,
+        chunk_size: int = CHUNK_SIZE,
+        on_chunk: Callable[[LoadReport], None] | None = None
+    ) -> LoadReport:
+    """
+    Streams a CSV or TSV edge list into the graph. The columns give the positions of the
+    source, destination and weight fields; a weight column of None loads every edge with
+    weight 1. In integer mode every id is mapped to a dense identifier named after it.
+    Otherwise alphabetic ids are kept as they are; a numeric id could turn into the label
+    of an alphabetic one, so a file mixing both kinds raises ValueError. So does a row
+    with too few fields or a weight that is not an integer, with its location.
+    """
+    report = LoadReport()
+    source_column, destination_column, weight_column = columns
+    width = max(column for column in columns if column is not None) + 1
+    ids = _VertexIds(graph)
+    kinds: set[bool] = set()
+
+    def label(field: str) -> str | int:
+        if ids.is_integer_ids():
+            return ids(field)
+
+        is_numeric = field.isdigit()
+
+        if is_numeric not in kinds:
+            kinds.add(is_numeric)
+
+            if len(kinds) > 1:
+                raise ValueError(f"{path} mixes numeric and alphabetic vertex ids")
+
+        return ids(field) if is_numeric else field
+
+    def entries() -> Iterator[tuple]:
+        with _open_text(path) as file:
+            rows = csv.reader(file, delimiter=delimiter)
+
+            if header:
+                next(rows, None)
+                report.lines += 1
+
+            for row in rows:
+                report.lines += 1
+
+                if not row:
+                    continue
+
+                if len(row) < width:
+                    raise _malformed(path, report.lines, f"expected at least {width} fields")
+
+                if weight_column is None:
+                    weight = 1
+                else:
+                    weight = _integer(row[weight_column], path, report.lines)
+                source = label(row[source_column].strip())
+                destination = label(row[destination_column].strip())
+
+                if directed:
+                    yield (source, destination, weight)
+                else:
+                    yield (source, destination, weight, weight)
+
+    return _ingest(graph, entries(), report, chunk_size, on_chunk, ids)
@@ -1,80 +1,88 @@
 """This module defines objects used in graph representation, including Vertex and Edge classes."""
 
 from typing import Unpack
-from dataclasses import dataclass
 from helper.validators import validate_labels, validate_param_keyword
 from helper.vertex_types import BFSVertexType, DFSVertexType, DijkstraVertexType
 from helper.edge_types import DFSEdgeType
-
-@dataclass
-class SpecialVertexAttributes:
-    """A dataclass that specifies attributes when working with the vertex."""
-    color: str = "gray"
-    predecessor: 'Vertex | None' = None
-    distance: int | float = float('inf')
-    discovery_time: int = 0
-    finish_time: int = 0
+from tools.api.state import StateStore, StoreHandle
 
 class Vertex:
-    """A class representing a vertex in a graph."""
+    """
+    A class representing a vertex in a graph.
+    Algorithm state is not kept on the vertex itself but in the slot at its position
+    in the StateStore that the handle shared by the whole graph currently points to.
+    Next to its edge list, the vertex indexes the first edge to every destination for
+    constant-time edge lookups.
+    """
+
+    __slots__ = ('__label', '__edges', '__adjacency', '__handle', '__position')
 
     @validate_labels('label')
-    def __init__(self, label: str):
-        self.__label: str = label
-        self.__special_attributes: SpecialVertexAttributes = SpecialVertexAttributes()
+    def __init__(self, label: str | int, handle: StoreHandle | None = None, position: int = 0):
+        self.__label: str | int = label
         self.__edges: list[Edge] = []
+        self.__adjacency: dict[Vertex, Edge] = {}
+        self.__handle: StoreHandle = handle if handle is not None else StoreHandle(StateStore(1))
+        self.__position: int = position
 
     def __repr__(self) -> str:
         """Returns a string representation of the edge."""
         return f"Vertex({self.get_label()})"
 
+    @classmethod
+    def _create(cls, label: str | int, handle: StoreHandle, position: int) -> 'Vertex':
+        """Creates a vertex whose label is known to be valid without validating it again."""
+        vertex = cls.__new__(cls)
+        cls.__init__.__wrapped__(vertex, label, handle, position)
+        return vertex
+
     def definition(self, algorithm: str) -> str:
         """Returns the definition of the vertex."""
-        vertex = f"Vertex({{label: {self.get_label()}"
-
         match algorithm:
             case 'bfs':
-                vertex += f", color: {self.get_color()}"
-                vertex += f", predecessor: {self.get_predecessor()}"
-                vertex += f", distance: {self.get_distance()}"
+                state = (
+                    f", color: {self.get_color()}"
+                    f", predecessor: {self.get_predecessor()}"
+                    f", distance: {self.get_distance()}"
+                )
             case 'dfs':
-                vertex += f", color: {self.get_color()}"
-                vertex += f", predecessor: {self.get_predecessor()}"
-                vertex += f", discovery: {self.get_discovery_time()}"
-                vertex += f", finish: {self.get_finish_time()}"
+                state = (
+                    f", color: {self.get_color()}"
+                    f", predecessor: {self.get_predecessor()}"
+                    f", discovery: {self.get_discovery_time()}"
+                    f", finish: {self.get_finish_time()}"
+                )
             case 'dijkstra':
-                vertex += f", predecessor: {self.get_predecessor()}"
-                vertex += f", distance: {self.get_distance()}"
-
-        edge_list = '['
-
-        for i, edge in enumerate(self.get_edges()):
-            if i != 0:
-                edge_list += ', '
-
-            edge_list += edge.definition(algorithm)
+                state = (
+                    f", predecessor: {self.get_predecessor()}"
+                    f", distance: {self.get_distance()}"
+                )
+            case _:
+                state = ''
 
-        edge_list += ']'
+        edge_list = ', '.join(edge.definition(algorithm) for edge in self.__edges)
 
-        vertex += f", edges: {edge_list}}})"
-
-        return vertex
+        return f"Vertex({{label: {self.get_label()}{state}, edges: [{edge_list}]}})"
 
     # -------------------------------------------------------------------------------
     # List of getter functions to all attributes of a vertex
     # -------------------------------------------------------------------------------
 
-    def get_label(self) -> str | None:
+    def get_label(self) -> str | int | None:
         """Returns the label of the vertex."""
         return self.__label
 
     def get_color(self) -> str:
         """Returns the color of the vertex."""
-        return self.__special_attributes.color
+        return self.__handle.store.get_color(self)
+
+    def get_color_code(self) -> int:
+        """Returns the interned color code of the vertex."""
+        return self.__handle.store.get_color_code(self)
 
     def get_predecessor(self) -> 'Vertex | None':
         """Returns the predecessor of the vertex."""
-        return self.__special_attributes.predecessor
+        return self.__handle.store.get_predecessor(self)
 
     def get_edges(self) -> list['Edge']:
         """Returns a list of edges that connect to other vertices."""
@@ -82,15 +90,35 @@ class Vertex:
 
     def get_distance(self) -> int | float:
         """Returns the BFS distance of the vertex."""
-        return self.__special_attributes.distance
+        return self.__handle.store.get_distance(self)
 
     def get_discovery_time(self) -> int | float:
         """Returns the DFS discovery time of the vertex."""
-        return self.__special_attributes.discovery_time
+        return self.__handle.store.get_discovery_time(self)
 
     def get_finish_time(self) -> int | float:
         """Returns the DFS finish time of the vertex."""
-        return self.__special_attributes.finish_time
+        return self.__handle.store.get_finish_time(self)
+
+    def get_edge_to(self, destination: 'Vertex') -> 'Edge | None':
+        """Returns the first edge of the vertex pointing to the given destination."""
+        return self.__adjacency.get(destination)
+
+    def has_edge_to(self, destination: 'Vertex') -> bool:
+        """Checks if the vertex has an edge pointing to the given destination."""
+        return destination in self.__adjacency
+
+    def _get_store(self) -> StateStore:
+        """Returns the store holding the algorithm state of the vertex."""
+        return self.__handle.store
+
+    def _get_layout(self) -> int:
+        """Returns the layout of the graph that the position of the vertex belongs to."""
+        return self.__handle.layout
+
+    def _get_position(self) -> int:
+        """Returns the slot of the vertex in its store."""
+        return self.__position
 
     # -------------------------------------------------------------------------------
     # END
@@ -101,14 +129,6 @@ class Vertex:
     # Edge should only be modified directly in the Edge class.
     # -------------------------------------------------------------------------------
 
-    def __update(self, this, **kwargs):
-        """Update after successfull validation of parameter keyword input."""
-        for key, value in kwargs.items():
-            if hasattr(this, key):
-                setattr(this, key, value)
-            else:
-                raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{key}'")
-
     @validate_param_keyword(BFSVertexType.__annotations__.keys())
     def update_bfs_attributes(self, **kwargs: Unpack[BFSVertexType]):
         """
@@ -117,7 +137,7 @@ class Vertex:
         - Predecessor
         - Distance
         """
-        self.__update(self.__special_attributes, **kwargs)
+        self.__handle.store.update(self.__position, **kwargs)
 
     @validate_param_keyword(DFSVertexType.__annotations__.keys())
     def update_dfs_attributes(self, **kwargs: Unpack[DFSVertexType]):
@@ -128,7 +148,7 @@ class Vertex:
         - Discovery Time
         - Finish Time
         """
-        self.__update(self.__special_attributes, **kwargs)
+        self.__handle.store.update(self.__position, **kwargs)
 
     @validate_param_keyword(DijkstraVertexType.__annotations__.keys())
     def update_dijkstra_attributes(self, **kwargs: Unpack[DijkstraVertexType]):
@@ -137,7 +157,11 @@ class Vertex:
         - Predecessor
         - Distance
         """
-        self.__update(self.__special_attributes, **kwargs)
+        self.__handle.store.update(self.__position, **kwargs)
+
+    def _relocate(self, position: int):
+        """Moves the vertex to another slot of its store."""
+        self.__position = position
 
     # -------------------------------------------------------------------------------
     # END
@@ -150,24 +174,38 @@ class Vertex:
     def add_edge(self, edge: 'Edge'):
         """Adds an edge to the vertex."""
         self.__edges.append(edge)
+        self.__adjacency.setdefault(edge.get_destination(), edge)
+
+    def add_edges(self, edges: list['Edge']):
+        """Adds several edges to the vertex at once."""
+        self.__edges.extend(edges)
+
+        for edge in edges:
+            self.__adjacency.setdefault(edge.get_destination(), edge)
+
+    def remove_edges_to(self, destination: 'Vertex'):
+        """Removes every edge of the vertex that points to the given destination."""
+        if self.__adjacency.pop(destination, None) is not None:
+            self.__edges = [
+                edge for edge in self.__edges if edge.get_destination() is not destination
+            ]
 
     # -------------------------------------------------------------------------------
     # END
     # -------------------------------------------------------------------------------
 
-@dataclass
-class SpecialEdgeAttributes:
-    """A dataclass that specifies attributes when working with the edge."""
-    weight: int
-    classification: str | None = None
-
 class Edge:
-    """A class representing an edge in a graph."""
+    """
+    A class representing an edge in a graph.
+    The DFS classification of the edge is kept in the store of its source vertex.
+    """
+
+    __slots__ = ('__source', '__destination', '__weight')
 
     def __init__(self, source: Vertex, destination: Vertex, weight: int = 1):
-        self.__source = source
-        self.__destination = destination
-        self.__special_attributes: SpecialEdgeAttributes = SpecialEdgeAttributes(weight)
+        self.__source: Vertex = source
+        self.__destination: Vertex = destination
+        self.__weight: int = weight
 
     def __repr__(self) -> str:
         """Returns a string representation of the edge."""
@@ -179,22 +217,15 @@ class Edge:
 
     def definition(self, algorithm: str) -> str:
         """Returns the definition of the edge."""
-        s = f"Edge({self.__source.get_label()}"
-        s += f", {self.__destination.get_label()}"
-
         match algorithm:
             case 'dfs':
-                s += f", {self.get_classification()}"
-            case "kruskal":
-                s += f", {self.get_weight()}"
-            case "prim":
-                s += f", {self.get_weight()}"
-            case 'dijkstra':
-                s += f", {self.get_weight()}"
-
-        s += ')'
+                detail = f", {self.get_classification()}"
+            case 'kruskal' | 'prim' | 'dijkstra':
+                detail = f", {self.__weight}"
+            case _:
+                detail = ''
 
-        return s
+        return f"Edge({self.__source.get_label()}, {self.__destination.get_label()}{detail})"
 
     # -------------------------------------------------------------------------------
     # List of getter functions to all attributes of an edge
@@ -210,11 +241,11 @@ class Edge:
 
     def get_weight(self) -> int:
         """Returns the weight of a vertex."""
-        return self.__special_attributes.weight
+        return self.__weight
 
     def get_classification(self) -> str | None:
         """Returns the classification of an edge when running DFS."""
-        return self.__special_attributes.classification
+        return self.__source._get_store().classification.get(self)
 
     # -------------------------------------------------------------------------------
     # END
@@ -226,21 +257,20 @@ class Edge:
     # class.
     # -------------------------------------------------------------------------------
 
-    def __update(self, this, **kwargs):
-        """Update after successfull validation of parameter keyword input."""
-        for key, value in kwargs.items():
-            if hasattr(this, key):
-                setattr(this, key, value)
-            else:
-                raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{key}'")
-
     @validate_param_keyword(DFSEdgeType.__annotations__.keys())
     def update_dfs_attributes(self, **kwargs: Unpack[DFSEdgeType]):
         """
         Updates DFS-specific attributes of the edge, including:
         - Classification
         """
-        self.__update(self.__special_attributes, **kwargs)
+        classification = self.__source._get_store().classification
+
+        if 'classification' in kwargs:
+            classification[self] = kwargs['classification']
+
+    def _set_weight(self, weight: int):
+        """Changes the weight of the edge; the graph owning it keeps track of the change."""
+        self.__weight = weight
 
     # -------------------------------------------------------------------------------
     # END
@@ -0,0 +1,69 @@
+"""This module places a frozen graph and result matrices in shared memory for worker processes.
+
+Worker processes attach to a block by its name instead of receiving a pickled copy, so
+the graph is copied once no matter how many processes read it.
+"""
+
+from array import array
+from multiprocessing.shared_memory import SharedMemory
+
+from tools.api.csr import CSRGraph
+
+ITEM_SIZE = array('q').itemsize
+
+class SharedGraph:
+    """
+    A class copying the offsets, targets and weights of a CSRGraph into one shared memory
+    block. Labels are not shared; processes attached to the block address vertices by id.
+    """
+
+    def __init__(self, graph: CSRGraph):
+        self.__vertex_count: int = graph.vertex_count()
+        self.__edge_count: int = graph.edge_count()
+        self.__block: SharedMemory = SharedMemory(
+            create=True, size=max(1, (self.__vertex_count + 1 + 2 * self.__edge_count) * ITEM_SIZE)
+        )
+        view = self.__block.buf.cast('q')
+        position = 0
+
+        for buffer in (graph.get_offsets(), graph.get_targets(), graph.get_weights()):
+            view[position:position + len(buffer)] = array('q', buffer)
+            position += len(buffer)
+
+        view.release()
+
+    def __enter__(self) -> 'SharedGraph':
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def get_handle(self) -> tuple[str, int, int]:
+        """Returns the picklable name and sizes a worker needs to attach to the block."""
+        return self.__block.name, self.__vertex_count, self.__edge_count
+
+    def close(self):
+        """Releases and removes the shared memory block."""
+        self.__block.close()
+        self.__block.unlink()
+
+    @staticmethod
+    def attach(handle: tuple[str, int, int]) -> tuple[SharedMemory, CSRGraph]:
+        """
+        Attaches to a shared graph from its handle. The returned block must stay referenced
+        for as long as the graph is used, and be closed afterwards.
+        """
+        name, vertex_count, edge_count = handle
+        block = SharedMemory(name=name)
+        view = block.buf.cast('q')
+        targets_start = vertex_count + 1
+        weights_start = targets_start + edge_count
+
+        graph = CSRGraph(
+            (),
+            view[:targets_start],
+            view[targets_start:weights_start],
+            view[weights_start:weights_start + edge_count]
+        )
+
+        return block, graph
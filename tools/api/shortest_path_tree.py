@@ -0,0 +1,147 @@
+"""This module defines an immutable shortest-path tree and a cache of trees for a graph."""
+
+from array import array
+from collections import OrderedDict
+from typing import Sequence
+
+from tools.api.object import Vertex
+from tools.api.state import StateStore
+
+class ShortestPathTree:
+    """
+    An immutable result of a single-source search. Distances and parents are kept in
+    arrays indexed by the position a vertex had when the tree was built, where a parent
+    of -1 marks the source or an unreached vertex. The tree maps vertices to those
+    indexes itself, so it stays valid whatever the graph's store holds later and after
+    vertices are removed from the graph and others move into their positions.
+    """
+
+    __slots__ = ('__vertices', '__index', '__source', '__distance', '__parent')
+
+    def __init__(self, vertices: Sequence[Vertex], source: Vertex, distance: array, parent: array):
+        self.__vertices: tuple[Vertex, ...] = tuple(vertices)
+        self.__index: dict[Vertex, int] = {
+            vertex: index for index, vertex in enumerate(self.__vertices)
+        }
+        self.__source: Vertex = source
+        self.__distance: array = distance
+        self.__parent: array = parent
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the tree."""
+        return (
+            f"ShortestPathTree(source={self.__source.get_label()}, "
+            f"vertices={len(self.__vertices)})"
+        )
+
+    @classmethod
+    def from_state(
+            cls,
+            vertices: Sequence[Vertex],
+            source: Vertex,
+            state: StateStore
+        ) -> 'ShortestPathTree':
+        """Copies the distances and predecessors of a finished search into a tree."""
+        distance = array('d', [float('inf')]) * len(vertices)
+        parent = array('q', [-1]) * len(vertices)
+
+        for position, vertex in enumerate(vertices):
+            if state.stamp[position] == state.epoch:
+                distance[position] = state.distance[position]
+                predecessor = state.predecessor[position]
+
+                if predecessor is not None:
+                    parent[position] = predecessor._get_position()
+
+        return cls(vertices, source, distance, parent)
+
+    # -------------------------------------------------------------------------------
+    # List of getter functions to the tree
+    # -------------------------------------------------------------------------------
+
+    def get_source(self) -> Vertex:
+        """Returns the root of the tree."""
+        return self.__source
+
+    def get_distance(self, vertex: Vertex) -> int | float:
+        """Returns the distance from the source to the vertex, or inf when it is unreached."""
+        index = self.__index.get(vertex)
+
+        if index is None or self.__distance[index] == float('inf'):
+            return float('inf')
+
+        return int(self.__distance[index])
+
+    def get_parent(self, vertex: Vertex) -> Vertex | None:
+        """Returns the vertex before the given one on its shortest path."""
+        index = self.__index.get(vertex)
+
+        if index is None or self.__parent[index] < 0:
+            return None
+
+        return self.__vertices[self.__parent[index]]
+
+    # -------------------------------------------------------------------------------
+    # END
+    # -------------------------------------------------------------------------------
+
+    def path_to(self, vertex: Vertex) -> list[Vertex]:
+        """
+        Returns the vertices of the shortest path from the source to the given vertex in
+        O(path length), or an empty list when the vertex is unreached.
+        """
+        index = self.__index.get(vertex)
+
+        if index is None or self.__distance[index] == float('inf'):
+            return []
+
+        path = []
+
+        while index >= 0:
+            path.append(self.__vertices[index])
+            index = self.__parent[index]
+
+        path.reverse()
+        return path
+
+class TreeCache:
+    """
+    A bounded least-recently-used cache of shortest-path trees keyed by graph version and
+    source vertex. Trees of an older version can never be hit again, so the cache is
+    emptied as soon as it sees a new version.
+    """
+
+    def __init__(self, maxsize: int = 32):
+        self.__maxsize: int = maxsize
+        self.__version: int = -1
+        self.__trees: OrderedDict[Vertex, ShortestPathTree] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Returns the number of cached trees."""
+        return len(self.__trees)
+
+    def get(self, version: int, source: Vertex) -> ShortestPathTree | None:
+        """Returns the cached tree of the source, marking it as the most recently used."""
+        if version != self.__version:
+            self.__trees.clear()
+            self.__version = version
+            return None
+
+        tree = self.__trees.get(source)
+
+        if tree is not None:
+            self.__trees.move_to_end(source)
+
+        return tree
+
+    def put(self, version: int, tree: ShortestPathTree):
+        """Caches a tree, evicting the least recently used one when the cache is full."""
+        if version != self.__version:
+            self.__trees.clear()
+            self.__version = version
+
+        self.__trees[tree.get_source()] = tree
+        self.__trees.move_to_end(tree.get_source())
+
+        while len(self.__trees) > self.__maxsize:
+            self.__trees.popitem(last=False)
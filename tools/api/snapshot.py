@@ -0,0 +1,95 @@
+"""This module saves a graph as a versioned binary snapshot and maps it back into memory.
+
+Layout of a snapshot, every integer little-endian:
+    header          magic b'AADGRAPH', version u32, reserved u32,
+                    vertex count u64, edge count u64, label blob size u64
+    offsets         (vertex count + 1) x i64
+    targets         edge count x i64
+    weights         edge count x i64
+    label offsets   (vertex count + 1) x i64 into the label blob
+    label blob      UTF-8 labels written back to back
+"""
+
+import struct
+from array import array
+from typing import Sequence
+
+from tools.api.binary_io import check_size, integers, little_endian, map_file
+from tools.api.csr import CSRGraph
+from tools.api.graph import Graph
+
+MAGIC = b'AADGRAPH'
+VERSION = 1
+HEADER = struct.Struct('<8sIIQQQ')
+
+class MappedLabels(Sequence[str]):
+    """A class exposing the label table of a snapshot, decoding a label only when it is read."""
+
+    def __init__(self, offsets: memoryview | array, blob: memoryview):
+        self.__offsets = offsets
+        self.__blob = blob
+
+    def __len__(self) -> int:
+        """Returns the number of labels in the table."""
+        return len(self.__offsets) - 1
+
+    def __getitem__(self, index):
+        """Returns the label of the vertex with the given identifier."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError('label index out of range')
+
+        return str(self.__blob[self.__offsets[index]:self.__offsets[index + 1]], 'utf-8')
+
+def save_snapshot(graph: Graph | CSRGraph, path: str):
+    """Writes the graph to the given path in the binary snapshot format."""
+    csr = graph.freeze() if isinstance(graph, Graph) else graph
+    encoded = [label.encode('utf-8') for label in csr.get_labels()]
+    label_offsets = array('q', [0])
+
+    for label in encoded:
+        label_offsets.append(label_offsets[-1] + len(label))
+
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(
+            MAGIC, VERSION, 0, csr.vertex_count(), csr.edge_count(), label_offsets[-1]
+        ))
+
+        for buffer in (csr.get_offsets(), csr.get_targets(), csr.get_weights(), label_offsets):
+            file.write(little_endian(buffer))
+
+        file.write(b''.join(encoded))
+
+def load_snapshot(path: str) -> CSRGraph:
+    """
+    Maps a snapshot into memory and returns it as a CSRGraph without copying its buffers.
+    The mapping is read-only and shared, so several processes opening the same file
+    share its pages.
+    """
+    buffer = map_file(path)
+
+    if len(buffer) < HEADER.size:
+        raise ValueError(f"{path} is not a graph snapshot")
+
+    magic, version, _, vertex_count, edge_count, blob_size = HEADER.unpack_from(buffer)
+
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a graph snapshot")
+
+    if version != VERSION:
+        raise ValueError(f"Unsupported graph snapshot version: {version}")
+
+    check_size(buffer, path, HEADER.size, 2 * (vertex_count + 1) + 2 * edge_count, blob_size)
+
+    offsets, position = integers(buffer, HEADER.size, vertex_count + 1)
+    targets, position = integers(buffer, position, edge_count)
+    weights, position = integers(buffer, position, edge_count)
+    label_offsets, position = integers(buffer, position, vertex_count + 1)
+    blob = buffer[position:position + blob_size]
+
+    return CSRGraph(MappedLabels(label_offsets, blob), offsets, targets, weights)
@@ -0,0 +1,194 @@
+"""This module defines the array-backed store that holds algorithm state for a graph's vertices."""
+
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tools.api.object import Vertex, Edge
+
+GRAY, RED, LIGHTBLUE = 0, 1, 2
+COLORS: tuple[str, ...] = ('gray', 'red', 'lightblue')
+COLOR_CODES: dict[str, int] = {color: code for code, color in enumerate(COLORS)}
+
+MAX_EPOCH = 2 ** 32 - 1
+
+class StoreHandle:
+    """
+    A reference to the store whose state a graph's vertices show. Every vertex of the graph
+    reads through the same handle, so publishing another store is a single assignment.
+    The handle also counts the layouts of the graph, which change whenever a removal
+    moves a vertex to another position.
+    """
+
+    __slots__ = ('store', 'layout')
+
+    def __init__(self, store: 'StateStore'):
+        self.store: StateStore = store
+        self.layout: int = 0
+
+class StateStore:
+    """
+    A class holding BFS, DFS and Dijkstra state of vertices in parallel arrays.
+    A vertex owns the slot at its position in the graph; colors are kept as the
+    one-byte codes GRAY, RED and LIGHTBLUE.
+
+    A slot only holds meaningful values when its stamp equals the current epoch,
+    otherwise it reads as the initial state. Starting a new run is therefore a single
+    epoch increment, and only the slots a run touches are ever written.
+
+    The store also remembers the layout of the graph it was filled for. Once a removal
+    has moved vertices to other positions, looking a vertex up raises ValueError instead
+    of reading the slot of whichever vertex took its position.
+    """
+
+    __slots__ = (
+        'color', 'predecessor', 'distance', 'discovery_time', 'finish_time',
+        'classification', 'stamp', 'epoch', 'layout'
+    )
+
+    def __init__(self, size: int = 0):
+        self.color: array = array('B', [GRAY]) * size
+        self.predecessor: list['Vertex | None'] = [None] * size
+        self.distance: array = array('d', [float('inf')]) * size
+        self.discovery_time: array = array('q', [0]) * size
+        self.finish_time: array = array('q', [0]) * size
+        self.classification: dict['Edge', str] = {}
+        self.stamp: array = array('I', [0]) * size
+        self.epoch: int = 1
+        self.layout: int = 0
+
+    def __len__(self) -> int:
+        """Returns the number of vertex slots in the store."""
+        return len(self.stamp)
+
+    # -------------------------------------------------------------------------------
+    # List of getter functions to the state of a single vertex or edge
+    # -------------------------------------------------------------------------------
+
+    def get_color(self, vertex: 'Vertex') -> str:
+        """Returns the color of the vertex."""
+        return COLORS[self.get_color_code(vertex)]
+
+    def get_color_code(self, vertex: 'Vertex') -> int:
+        """Returns the interned color code of the vertex."""
+        position = self.__position(vertex)
+        return self.color[position] if self.stamp[position] == self.epoch else GRAY
+
+    def get_predecessor(self, vertex: 'Vertex') -> 'Vertex | None':
+        """Returns the predecessor of the vertex."""
+        position = self.__position(vertex)
+        return self.predecessor[position] if self.stamp[position] == self.epoch else None
+
+    def get_distance(self, vertex: 'Vertex') -> int | float:
+        """Returns the BFS or Dijkstra distance of the vertex."""
+        position = self.__position(vertex)
+
+        if self.stamp[position] != self.epoch or self.distance[position] == float('inf'):
+            return float('inf')
+
+        return int(self.distance[position])
+
+    def get_discovery_time(self, vertex: 'Vertex') -> int:
+        """Returns the DFS discovery time of the vertex."""
+        position = self.__position(vertex)
+        return self.discovery_time[position] if self.stamp[position] == self.epoch else 0
+
+    def get_finish_time(self, vertex: 'Vertex') -> int:
+        """Returns the DFS finish time of the vertex."""
+        position = self.__position(vertex)
+        return self.finish_time[position] if self.stamp[position] == self.epoch else 0
+
+    def get_classification(self, edge: 'Edge') -> str | None:
+        """Returns the DFS classification of the edge."""
+        return self.classification.get(edge)
+
+    # -------------------------------------------------------------------------------
+    # END
+    # -------------------------------------------------------------------------------
+
+    def __position(self, vertex: 'Vertex') -> int:
+        """Returns the slot of the vertex, checking the store matches the graph's layout."""
+        if vertex._get_layout() != self.layout:
+            raise ValueError('The state was recorded before a vertex was removed from the graph')
+
+        return vertex._get_position()
+
+    def begin(self, size: int = 0):
+        """
+        Starts a new run by moving to the next epoch, which invalidates every slot at once.
+        The store grows to the given size when it holds fewer slots.
+        """
+        while len(self) < size:
+            self.append()
+
+        self.epoch += 1
+        self.classification = {}
+
+        if self.epoch > MAX_EPOCH:
+            self.stamp = array('I', [0]) * len(self)
+            self.epoch = 1
+
+    def copy(self) -> 'StateStore':
+        """Returns an independent store holding the same state."""
+        store = StateStore()
+        store.color = self.color[:]
+        store.predecessor = self.predecessor[:]
+        store.distance = self.distance[:]
+        store.discovery_time = self.discovery_time[:]
+        store.finish_time = self.finish_time[:]
+        store.classification = dict(self.classification)
+        store.stamp = self.stamp[:]
+        store.epoch = self.epoch
+        store.layout = self.layout
+        return store
+
+    def touch(self, position: int):
+        """Brings a slot into the current epoch with its initial state."""
+        if self.stamp[position] != self.epoch:
+            self.stamp[position] = self.epoch
+            self.color[position] = GRAY
+            self.predecessor[position] = None
+            self.distance[position] = float('inf')
+            self.discovery_time[position] = 0
+            self.finish_time[position] = 0
+
+    def append(self):
+        """Adds a slot holding the initial state of a new vertex."""
+        self.color.append(GRAY)
+        self.predecessor.append(None)
+        self.distance.append(float('inf'))
+        self.discovery_time.append(0)
+        self.finish_time.append(0)
+        self.stamp.append(0)
+
+    def swap_remove(self, position: int):
+        """Removes a slot by moving the last slot into its position."""
+        for values in (
+            self.color, self.predecessor, self.distance,
+            self.discovery_time, self.finish_time, self.stamp
+        ):
+            last = values.pop()
+
+            if position < len(values):
+                values[position] = last
+
+    def update(self, position: int, **kwargs):
+        """Updates the state of the vertex at the given position."""
+        self.touch(position)
+
+        for key, value in kwargs.items():
+            match key:
+                case 'color':
+                    self.color[position] = value if isinstance(value, int) else COLOR_CODES[value]
+                case 'predecessor':
+                    self.predecessor[position] = value
+                case 'distance':
+                    self.distance[position] = value
+                case 'discovery_time':
+                    self.discovery_time[position] = value
+                case 'finish_time':
+                    self.finish_time[position] = value
+                case _:
+                    raise AttributeError(
+                        f"'{self.__class__.__name__}' object has no attribute '{key}'"
+                    )